@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from LoginChecker import LinearSearchChecker, BinarySearchChecker, HashTable, OptimizedBloomFilter, UltraFastCuckooFilter, generate_username
 
 class TestLoginCheckers(unittest.TestCase):
@@ -10,6 +11,25 @@ class TestLoginCheckers(unittest.TestCase):
         self.assertTrue(checker.check("user123"))
         self.assertFalse(checker.check("not_in_list"))
 
+    def test_linear_search_prepared(self):
+        checker = LinearSearchChecker()
+        for x in range(1000):
+            checker.insert(x)
+        checker.prepare()
+        self.assertTrue(checker.check(999))
+        self.assertFalse(checker.check(-1))
+        checker.insert(-1)  # An insert after prepare() is still found
+        self.assertTrue(checker.check(-1))
+
+    def test_linear_search_prepared_mixed_types(self):
+        checker = LinearSearchChecker()
+        checker.insert(1)
+        checker.insert("alice")
+        checker.prepare()
+        self.assertTrue(checker.check(1))
+        self.assertTrue(checker.check("alice"))
+        self.assertFalse(checker.check("1"))  # Not coerced to strings
+
     def test_binary_search(self):
         checker = BinarySearchChecker()
         usernames = ["alice", "bob", "charlie", "david"]
@@ -25,6 +45,17 @@ class TestLoginCheckers(unittest.TestCase):
         self.assertTrue(checker.check("user789"))
         self.assertFalse(checker.check("unknown_user"))
 
+    def test_bulk_build(self):
+        binary, ht = BinarySearchChecker(), HashTable()
+        logins = ["dave", "alice", "carol"]
+        binary.bulk_build(logins)
+        ht.bulk_build(logins)
+        self.assertEqual(binary.logins, ["alice", "carol", "dave"])  # Sorted copy, input left as is
+        self.assertEqual(logins, ["dave", "alice", "carol"])
+        for checker in (binary, ht):
+            self.assertTrue(checker.check("carol"))
+            self.assertFalse(checker.check("bob"))
+
     def test_bloom_filter(self):
         bf = OptimizedBloomFilter(1000)
         bf.insert("alice")
@@ -32,6 +63,25 @@ class TestLoginCheckers(unittest.TestCase):
         self.assertTrue(bf.check("alice"))  # Should be True
         self.assertFalse(bf.check("not_in_list"))  # Should be False (low FP rate)
 
+    def test_bloom_filter_insert_many(self):
+        single, bulk = OptimizedBloomFilter(1000), OptimizedBloomFilter(1000)
+        for x in range(500):
+            single.insert(x)
+        bulk.insert_many(np.arange(500))
+        self.assertTrue((single.bit_array == bulk.bit_array).all())  # Same bits as one insert() per login
+        bulk.insert_many(["alice", "bob"])
+        self.assertEqual(bulk.check_many(["alice", "bob", 42]).tolist(), [True, True, True])
+        self.assertFalse(bulk.check("not_in_list"))
+
+    def test_bloom_filter_int_types(self):
+        bf = OptimizedBloomFilter(1000)
+        bf.insert(np.int64(42))
+        bf.insert(True)
+        bf.insert_many([np.int64(x) for x in range(5)] + [np.uint8(200), 2**70])
+        for login in (42, 1, 3, 200, 2**70):  # Equal integers hash alike whatever their type
+            self.assertTrue(bf.check(login), f"False negative for {login!r}.")
+        self.assertTrue(bf.check_many([42, 3, 200]).all())
+
     def test_cuckoo_filter(self):
         cf = UltraFastCuckooFilter(1000)
         cf.insert("henry")
@@ -39,6 +89,17 @@ class TestLoginCheckers(unittest.TestCase):
         self.assertTrue(cf.check("henry"))
         self.assertFalse(cf.check("unknown_user"))
 
+    def test_cuckoo_filter_int_types(self):
+        cf = UltraFastCuckooFilter(1000)
+        for login in (np.int64(7), True, np.uint8(200), 2**70):
+            cf.insert(login)
+        for login in (7, 1, 200, np.int32(200), 2**70):  # Equal integers hash alike whatever their type
+            self.assertTrue(cf.check(login), f"False negative for {login!r}.")
+
+    def test_cuckoo_filter_empty(self):
+        cf = UltraFastCuckooFilter(1000)
+        self.assertFalse(any(cf.check(x) for x in range(10_000)))  # A zero fingerprint must not match an empty slot
+
     def test_generate_username(self):
         username = generate_username()
         self.assertTrue(isinstance(username, str))
@@ -2,32 +2,64 @@
 References:
 1. Wikipedia: AVL Tree — https://en.wikipedia.org/wiki/AVL_tree
 2. GeeksforGeeks: Various articles on BST and self-balancing trees
+3. Algorithmica: Eytzinger Binary Search — https://en.algorithmica.org/hpc/data-structures/binary-search/
+4. Demaine: Cache-Oblivious Algorithms and Data Structures (van Emde Boas layout)
 """
 
+import struct
+from array import array
+
+INF = float('inf')  # Padding key for the triangle snapshot
+
+# One record of the van Emde Boas dump: key, then byte offsets of the left and
+# right child records (-1 if absent). Little-endian with no padding: 16 bytes.
+VEB_RECORD = struct.Struct('<qii')
+
 class AVLNode:
+    __slots__ = ('key', 'left', 'right', 'bf')
+
+    # Free list of released nodes shared by all trees, reused by _get()
+    _pool = []
+    _POOL_MAX = 1 << 16
+
     def __init__(self, key):
         self.key = key
         self.left = None
         self.right = None
-        self.height = 1  # Used to track balance factor
+        self.bf = 0  # Balance factor: height(left) - height(right), always -1, 0 or +1
 
-def get_height(node):
-    """
-    Return the height of the given node.
-    If node is None, returns 0.
-    """
-    if not node:
-        return 0
-    return node.height
+    @classmethod
+    def _get(cls, key):
+        """
+        Return a fresh leaf node for 'key', reusing a pooled node when available.
+        """
+        pool = cls._pool
+        if pool:
+            node = pool.pop()
+            node.key = key
+            node.bf = 0
+            return node
+        return cls(key)
+
+    @classmethod
+    def _release(cls, node):
+        """
+        Clear a node that has been unlinked from its tree and return it to the pool.
+        """
+        pool = cls._pool
+        if len(pool) < cls._POOL_MAX:
+            node.key = node.left = node.right = None
+            pool.append(node)
 
 def get_balance(node):
     """
-    Compute and return the balance factor of the given node:
+    Return the balance factor of the given node:
     (height(left subtree) - height(right subtree)).
+    If node is None, returns 0.
     """
     if not node:
         return 0
-    return get_height(node.left) - get_height(node.right)
+    return node.bf
 
 def right_rotate(z):
     """
@@ -40,9 +72,10 @@ def right_rotate(z):
     y.right = z
     z.left = T3
     
-    # Update heights
-    z.height = 1 + max(get_height(z.left), get_height(z.right))
-    y.height = 1 + max(get_height(y.left), get_height(y.right))
+    # Update balance factors from the old ones; no subtree heights needed
+    z_bf = z.bf - 1 - (y.bf if y.bf > 0 else 0)
+    z.bf = z_bf
+    y.bf = y.bf - 1 + (z_bf if z_bf < 0 else 0)
     
     # y becomes the new root
     return y
@@ -57,146 +90,510 @@ def left_rotate(z):
     y.left = z
     z.right = T2
     
-    # Update heights
-    z.height = 1 + max(get_height(z.left), get_height(z.right))
-    y.height = 1 + max(get_height(y.left), get_height(y.right))
+    # Update balance factors (mirror of right_rotate)
+    z_bf = z.bf + 1 - (y.bf if y.bf < 0 else 0)
+    z.bf = z_bf
+    y.bf = y.bf + 1 + (z_bf if z_bf > 0 else 0)
     
     return y
 
+def eytzinger_fill(sorted_keys, a):
+    """
+    Write 'sorted_keys' into 'a' in Eytzinger (BFS) order: slot 1 is the root and
+    slot k has children 2k and 2k+1. 'a' must have len(sorted_keys) + 1 slots.
+    """
+    n = len(sorted_keys)
+    it = iter(sorted_keys)
+    stack = []
+    k = 1
+    # In-order walk over the implicit tree 1..n
+    while stack or k <= n:
+        while k <= n:
+            stack.append(k)
+            k = 2 * k
+        k = stack.pop()
+        a[k] = next(it)
+        k = 2 * k + 1
+    return a
+
+def eytzinger_search(a, key):
+    """
+    Return True if 'key' is in the Eytzinger-ordered array 'a' (slot 0 unused).
+    """
+    n = len(a) - 1
+
+    # Branch-free descent to the lower bound of 'key'
+    k = 1
+    while k <= n:
+        k = 2 * k + (key > a[k])
+
+    # Undo the trailing right turns plus the final left turn (k >> ffs(~k))
+    k >>= (~k & (k + 1)).bit_length()
+    return k != 0 and a[k] == key
+
+def veb_order(root):
+    """
+    Return the nodes of the tree rooted at 'root' in van Emde Boas order: the
+    top half of the levels is laid out first (recursively in the same order),
+    followed by each subtree hanging below it, one after another.
+    """
+    out = []
+    h = 0
+    node = root
+    # The taller side is always the one the balance factor leans to
+    while node:
+        h += 1
+        node = node.left if node.bf >= 0 else node.right
+    if root:
+        _veb_emit(root, h, out)
+    return out
+
+def _veb_emit(node, h, out):
+    """
+    Append the nodes of depth < h in the subtree rooted at 'node' to 'out', in vEB order.
+    """
+    if h == 1:
+        out.append(node)
+        return
+    top = h >> 1
+    _veb_emit(node, top, out)
+    level = [node]
+    for _ in range(top):
+        level = [c for n in level for c in (n.left, n.right) if c]
+    for n in level:
+        _veb_emit(n, h - top, out)
+
+def search_veb(buf, key):
+    """
+    Return True if 'key' exists in a tree dumped by AVLTree.to_veb_bytes().
+    'buf' may be any buffer holding the dump (bytes, bytearray, memoryview, mmap).
+    """
+    unpack_from = VEB_RECORD.unpack_from
+    off = 0 if len(buf) else -1
+    while off >= 0:
+        k, left, right = unpack_from(buf, off)
+        if k == key:
+            return True
+        off = left if key < k else right
+    return False
+
+class TopLevelCache:
+    """
+    Flat breadth-first copy of the top LEVELS levels of an AVL tree.
+
+    keys[i] (1 <= i < SIZE) is the key of the node at BFS slot i, or None if the
+    tree has no node there; slot i has children 2i and 2i+1. nodes[i] for
+    SIZE <= i < 2*SIZE is the node one level further down, where a lookup
+    continues with the ordinary pointer search.
+    """
+    LEVELS = 7
+    SIZE = 1 << LEVELS  # 127 cached keys in slots 1..127
+
+    __slots__ = ('keys', 'nodes')
+
+    def __init__(self, root):
+        size = self.SIZE
+        keys = [None] * size
+        nodes = [None] * (2 * size)
+        nodes[1] = root
+        for i in range(1, size):
+            node = nodes[i]
+            if node:
+                keys[i] = node.key
+                nodes[2 * i] = node.left
+                nodes[2 * i + 1] = node.right
+        self.keys = keys
+        self.nodes = nodes
+
 class AVLTree:
     """
     An AVL (self-balancing) Binary Search Tree implementation.
     """
     def __init__(self):
         self.root = None
+        self._frozen = None  # Eytzinger snapshot built by freeze()
+        self._triangles = None  # Triangle snapshot built by freeze_triangles()
+        self._top = None     # TopLevelCache, rebuilt lazily by search_top()
+        self._mru = [None] * 4  # Recent (key, found) search results, slot = hash(key) & 3
 
     def insert(self, key):
         """
         Insert 'key' into the AVL Tree and rebalance if needed.
         """
+        self._frozen = self._triangles = None
+        self._mru[hash(key) & 3] = None
         self.root = self._insert(self.root, key)
 
     def _insert(self, node, key):
-        # Normal BST insertion
-        if not node:
-            return AVLNode(key)
-        elif key < node.key:
-            node.left = self._insert(node.left, key)
-        else:
-            node.right = self._insert(node.right, key)
-        
-        # Update height of this ancestor node
-        node.height = 1 + max(get_height(node.left), get_height(node.right))
-        
-        # Get the balance factor
-        balance = get_balance(node)
-        
-        # If the node is unbalanced, then try out the 4 rotation cases:
-
-        # Case 1: Left Left
-        if balance > 1 and key < node.left.key:
-            return right_rotate(node)
-        
-        # Case 2: Right Right
-        if balance < -1 and key > node.right.key:
-            return left_rotate(node)
-        
-        # Case 3: Left Right
-        if balance > 1 and key > node.left.key:
-            node.left = left_rotate(node.left)
-            return right_rotate(node)
-        
-        # Case 4: Right Left
-        if balance < -1 and key < node.right.key:
-            node.right = right_rotate(node.right)
-            return left_rotate(node)
-        
+        """
+        Internal iterative insertion into the subtree rooted at 'node'.
+        The descent path is recorded on an explicit stack of (ancestor, went_left)
+        pairs, which is then unwound to update balance factors and rebalance.
+        Returns the new subtree root.
+        """
+        root = node
+        stack = []
+
+        # Normal BST descent, remembering the path
+        while node:
+            went_left = key < node.key
+            stack.append((node, went_left))
+            node = node.left if went_left else node.right
+        node = AVLNode._get(key)
+
+        # Direction taken out of the child we just came up from; this decides
+        # between the outside (LL/RR) and inside (LR/RL) rotation cases.
+        child_went_left = None
+        while stack:
+            parent, went_left = stack.pop()
+            if went_left:
+                parent.left = node
+            else:
+                parent.right = node
+
+            # The child subtree grew by one level
+            balance = parent.bf + 1 if went_left else parent.bf - 1
+            parent.bf = balance
+
+            # Subtree height unchanged: no ancestor above can be affected
+            if balance == 0:
+                self._note_change(len(stack))
+                return root
+
+            # Still balanced, but one level taller: keep going up
+            if -1 <= balance <= 1:
+                node = parent
+                child_went_left = went_left
+                continue
+
+            # If the node is unbalanced, then try out the 4 rotation cases:
+
+            # Case 1: Left Left
+            if balance > 1 and child_went_left:
+                node = right_rotate(parent)
+
+            # Case 2: Right Right
+            elif balance < -1 and not child_went_left:
+                node = left_rotate(parent)
+
+            # Case 3: Left Right
+            elif balance > 1:
+                parent.left = left_rotate(parent.left)
+                node = right_rotate(parent)
+
+            # Case 4: Right Left
+            else:
+                parent.right = right_rotate(parent.right)
+                node = left_rotate(parent)
+
+            # An insertion rotation restores the subtree's old height, so relink
+            # the new subtree root and stop
+            self._note_change(len(stack))
+            if not stack:
+                return node
+            parent, went_left = stack[-1]
+            if went_left:
+                parent.left = node
+            else:
+                parent.right = node
+            return root
+
+        self._note_change(0)
         return node
 
+    def _note_change(self, depth):
+        """
+        Record that insert/delete modified the tree at 'depth' (root = 0) and below.
+        The top-level cache is only discarded if the change reaches the cached levels.
+        """
+        if depth <= TopLevelCache.LEVELS:
+            self._top = None
+
+    def bulk_load(self, keys):
+        """
+        Replace the tree's contents with 'keys', building a perfectly balanced
+        tree in O(n) after sorting: each subtree root is the median of its key
+        range, so no rotations or rebalancing are needed. A subtree over s keys
+        built this way has height s.bit_length(), which gives each balance factor.
+        """
+        keys = sorted(keys)
+        self._frozen = self._triangles = None
+        self._mru = [None] * 4
+        self._note_change(0)
+
+        root = None
+        # Explicit stack of (lo, hi, parent, is_left) key ranges still to build
+        stack = [(0, len(keys), None, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) >> 1
+            node = AVLNode(keys[mid])
+            node.bf = (mid - lo).bit_length() - (hi - mid - 1).bit_length()
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((lo, mid, node, True))
+            stack.append((mid + 1, hi, node, False))
+        self.root = root
+
     def search(self, key):
         """
         Return True if 'key' exists in the AVL Tree, False otherwise.
+        The last result for each of 4 hash slots is remembered, so repeated
+        lookups of a recently searched key skip the descent. An insert/delete
+        of a key only clears that key's slot: no other cached result can change.
         """
-        return self._search(self.root, key)
+        slot = hash(key) & 3
+        hit = self._mru[slot]
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        found = self._search(self.root, key)
+        self._mru[slot] = (key, found)
+        return found
+
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' exist in the tree, walking each one in
+        this loop instead of calling search() per query (no result cache).
+        """
+        root = self.root
+        count = 0
+        for key in queries:
+            node = root
+            while node:
+                k = node.key
+                if k == key:
+                    count += 1
+                    break
+                node = node.left if key < k else node.right
+        return count
 
     def _search(self, node, key):
-        if not node:
-            return False
-        if node.key == key:
-            return True
-        elif key < node.key:
-            return self._search(node.left, key)
-        else:
-            return self._search(node.right, key)
+        while node:
+            k = node.key
+            if k == key:
+                return True
+            node = node.left if key < k else node.right
+        return False
+
+    def search_top(self, key):
+        """
+        Return True if 'key' exists, reading the top levels from the flat
+        TopLevelCache and following node pointers only for the rest of the descent.
+        """
+        top = self._top
+        if top is None:
+            top = self._top = TopLevelCache(self.root)
+        keys = top.keys
+        i = 1
+        while i < TopLevelCache.SIZE:
+            k = keys[i]
+            if k is None:
+                return False
+            if k == key:
+                return True
+            i = 2 * i + (key > k)
+        return self._search(top.nodes[i], key)
+
+    def freeze(self):
+        """
+        Snapshot the keys into an Eytzinger-ordered array('q') for read-only lookups.
+        Slot 1 holds the root and slot k has children 2k and 2k+1, so search_frozen()
+        descends by index arithmetic instead of chasing node pointers.
+        Keys must be int64. Any insert/delete discards the snapshot.
+        """
+        keys = self._inorder_keys()
+        a = array('q', bytes(8 * (len(keys) + 1)))  # slot 0 is unused
+        self._frozen = eytzinger_fill(keys, a)
+        return a
+
+    def search_frozen(self, key):
+        """
+        Return True if 'key' exists, using the Eytzinger snapshot (built on demand).
+        """
+        a = self._frozen
+        if a is None:
+            a = self.freeze()
+        return eytzinger_search(a, key)
+
+    def freeze_triangles(self):
+        """
+        Snapshot the keys as "triangles": each entry packs a node with both of its
+        children as one (parent, left, right) tuple, so search_triangles() resolves
+        two levels per load. Keys are padded with +inf up to a complete tree, laid
+        out in Eytzinger order, and tri[k] is the triangle rooted at slot k (every
+        other level). Keys must be numeric. Any insert/delete discards the snapshot.
+        """
+        keys = self._inorder_keys()
+        levels = len(keys).bit_length()
+        m = (1 << levels) - 1
+        e = eytzinger_fill(keys + [INF] * (m - len(keys)), [None] * (m + 1))
+
+        tri = [None] * (m + 1)
+        for depth in range(0, levels - 1, 2):
+            for k in range(1 << depth, 2 << depth):
+                tri[k] = (e[k], e[2 * k], e[2 * k + 1])
+
+        self._triangles = (tri, e, levels)
+        return self._triangles
+
+    def search_triangles(self, key):
+        """
+        Return True if 'key' exists, using the triangle snapshot (built on demand).
+        """
+        snapshot = self._triangles
+        if snapshot is None:
+            snapshot = self.freeze_triangles()
+        tri, e, levels = snapshot
+
+        # Two levels per step: pick one of the 4 grandchildren from one tuple
+        k = 1
+        for _ in range(levels >> 1):
+            parent_key, left_key, right_key = tri[k]
+            if key > parent_key:
+                k = 4 * k + 2 + (key > right_key)
+            else:
+                k = 4 * k + (key > left_key)
+        if levels & 1:
+            k = 2 * k + (key > e[k])
+
+        # Same lower-bound recovery as eytzinger_search()
+        k >>= (~k & (k + 1)).bit_length()
+        return k != 0 and e[k] == key
+
+    def to_veb_bytes(self):
+        """
+        Serialize the tree into a bytearray of VEB_RECORD records in van Emde
+        Boas order, with the root at offset 0. Children are referenced by byte
+        offset, so the blob can be written to disk and searched in place (e.g.
+        through mmap) with search_veb(). Keys must be int64.
+        """
+        nodes = veb_order(self.root)
+        size = VEB_RECORD.size
+        offset = {id(node): i * size for i, node in enumerate(nodes)}
+        buf = bytearray(len(nodes) * size)
+        pack_into = VEB_RECORD.pack_into
+        for i, node in enumerate(nodes):
+            left = offset[id(node.left)] if node.left else -1
+            right = offset[id(node.right)] if node.right else -1
+            pack_into(buf, i * size, node.key, left, right)
+        return buf
+
+    def _inorder_keys(self):
+        """
+        Return all keys in sorted order (iterative in-order traversal).
+        """
+        keys = []
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            keys.append(node.key)
+            node = node.right
+        return keys
 
     def delete(self, key):
         """
         Delete 'key' from the AVL Tree if it exists.
         """
+        self._frozen = self._triangles = None
+        self._mru[hash(key) & 3] = None
         self.root = self._delete(self.root, key)
 
     def _delete(self, node, key):
         """
-        Internal recursive method to delete 'key' from subtree rooted at 'node'.
+        Internal iterative method to delete 'key' from subtree rooted at 'node'.
         Returns the new subtree root after deletion and rebalancing.
         """
-        if not node:
-            return node
+        root = node
+        stack = []
 
         # 1) Perform BST delete
-        if key < node.key:
-            node.left = self._delete(node.left, key)
-        elif key > node.key:
-            node.right = self._delete(node.right, key)
-        else:
-            # Node found
-            if not node.left:
-                # If left child is None, replace node with right child
-                return node.right
-            elif not node.right:
-                # If right child is None, replace node with left child
-                return node.left
-            else:
-                # Node with two children: replace with inorder successor
-                temp = self._min_value_node(node.right)
-                node.key = temp.key
-                node.right = self._delete(node.right, temp.key)
+        while node and node.key != key:
+            went_left = key < node.key
+            stack.append((node, went_left))
+            node = node.left if went_left else node.right
 
-        # If the tree had only one node, simply return
         if not node:
-            return node
+            # Key not found
+            return root
 
-        # 2) Update height of current node
-        node.height = 1 + max(get_height(node.left), get_height(node.right))
-        
-        # 3) Get the balance factor and rebalance if needed
-        balance = get_balance(node)
+        if node.left and node.right:
+            # Node with two children: replace with inorder successor,
+            # then splice the successor out of the right subtree instead
+            self._note_change(len(stack))
+            stack.append((node, False))
+            temp = node.right
+            while temp.left:
+                stack.append((temp, True))
+                temp = temp.left
+            node.key = temp.key
+            node = temp
 
-        # Left Left
-        if balance > 1 and get_balance(node.left) >= 0:
-            return right_rotate(node)
+        # Node now has at most one child: replace node with that child
+        removed = node
+        node = node.left if node.left else node.right
+        AVLNode._release(removed)
 
-        # Left Right
-        if balance > 1 and get_balance(node.left) < 0:
-            node.left = left_rotate(node.left)
-            return right_rotate(node)
+        while stack:
+            parent, went_left = stack.pop()
+            if went_left:
+                parent.left = node
+            else:
+                parent.right = node
 
-        # Right Right
-        if balance < -1 and get_balance(node.right) <= 0:
-            return left_rotate(node)
+            # 2) The child subtree shrank by one level
+            balance = parent.bf - 1 if went_left else parent.bf + 1
+            parent.bf = balance
 
-        # Right Left
-        if balance < -1 and get_balance(node.right) > 0:
-            node.right = right_rotate(node.right)
-            return left_rotate(node)
+            # Subtree height unchanged: no ancestor above can be affected
+            if balance == 1 or balance == -1:
+                self._note_change(len(stack))
+                return root
 
-        return node
+            # 3) Rebalance if needed
+            if balance == 0:
+                node = parent
+                continue
 
-    def _min_value_node(self, node):
-        """
-        Helper method to find the node with the smallest key in a subtree (used for inorder successor).
-        """
-        current = node
-        while current.left:
-            current = current.left
-        return current
+            # Left Left
+            if balance > 1 and get_balance(parent.left) >= 0:
+                node = right_rotate(parent)
+
+            # Left Right
+            elif balance > 1:
+                parent.left = left_rotate(parent.left)
+                node = right_rotate(parent)
+
+            # Right Right
+            elif get_balance(parent.right) <= 0:
+                node = left_rotate(parent)
+
+            # Right Left
+            else:
+                parent.right = right_rotate(parent.right)
+                node = left_rotate(parent)
+
+            # A single rotation around an evenly balanced child keeps the
+            # subtree's height: relink the new subtree root and stop
+            if node.bf != 0:
+                self._note_change(len(stack))
+                if not stack:
+                    return node
+                parent, went_left = stack[-1]
+                if went_left:
+                    parent.left = node
+                else:
+                    parent.right = node
+                return root
+
+        self._note_change(0)
+        return node
@@ -0,0 +1,298 @@
+"""
+References:
+1. Wikipedia: AVL Tree — https://en.wikipedia.org/wiki/AVL_tree
+2. GeeksforGeeks: Various articles on BST and self-balancing trees
+
+Array-backed (struct-of-arrays) variant of AVL_Tree.py.
+Instead of one Python object per node, every node is an integer index into
+parallel arrays (keys, left, right, height). Child "pointers" are plain ints,
+so a traversal touches compact C arrays rather than scattered heap objects.
+Keys are specialized to int64 and stored in an array('q'); inserting any other
+type (float, str, ...) raises TypeError.
+"""
+
+from array import array
+
+NIL = -1  # Index used in place of a None child
+
+class ArrayAVLTree:
+    """
+    An AVL (self-balancing) Binary Search Tree stored as parallel arrays.
+
+    Attributes:
+        keys: array('q') of int64 keys, indexed by node id.
+        left, right: array('i') of child node ids (NIL if absent).
+        height: array('b') of subtree heights.
+        root: Node id of the root (NIL if the tree is empty).
+    """
+    def __init__(self):
+        self.keys = array('q')
+        self.left = array('i')
+        self.right = array('i')
+        self.height = array('b')
+        self._free = []  # Node ids released by delete, reused by _alloc
+        self.root = NIL
+
+    def _alloc(self, key):
+        """
+        Allocate a leaf node holding 'key' and return its id.
+        Reuses a freed slot when one is available.
+        """
+        if self._free:
+            i = self._free[-1]
+            self.keys[i] = key  # Raises TypeError for a non-int key before any change
+            self._free.pop()
+            self.left[i] = NIL
+            self.right[i] = NIL
+            self.height[i] = 1
+            return i
+        self.keys.append(key)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.height.append(1)
+        return len(self.keys) - 1
+
+    def _release(self, i):
+        """
+        Return node 'i' to the free list.
+        """
+        self._free.append(i)
+
+    def _get_balance(self, i):
+        """
+        Balance factor of node 'i': height(left) - height(right).
+        """
+        if i < 0:
+            return 0
+        height = self.height
+        l, r = self.left[i], self.right[i]
+        return (0 if l < 0 else height[l]) - (0 if r < 0 else height[r])
+
+    def _right_rotate(self, z):
+        """
+        Right-rotate around node z and return the new root of that subtree.
+        """
+        left, right, height = self.left, self.right, self.height
+        y = left[z]
+        t3 = right[y]
+        left[z] = t3
+        right[y] = z
+
+        # z's new children are t3 and its old right child; y's are its old
+        # left child and z, whose height is the one just computed
+        r = right[z]
+        hl = 0 if t3 < 0 else height[t3]
+        hr = 0 if r < 0 else height[r]
+        hz = height[z] = 1 + (hl if hl > hr else hr)
+        l = left[y]
+        hl = 0 if l < 0 else height[l]
+        height[y] = 1 + (hl if hl > hz else hz)
+        return y
+
+    def _left_rotate(self, z):
+        """
+        Left-rotate around node z and return the new root of that subtree.
+        """
+        left, right, height = self.left, self.right, self.height
+        y = right[z]
+        t2 = left[y]
+        right[z] = t2
+        left[y] = z
+
+        # Mirror of _right_rotate
+        l = left[z]
+        hl = 0 if l < 0 else height[l]
+        hr = 0 if t2 < 0 else height[t2]
+        hz = height[z] = 1 + (hl if hl > hr else hr)
+        r = right[y]
+        hr = 0 if r < 0 else height[r]
+        height[y] = 1 + (hr if hr > hz else hz)
+        return y
+
+    def insert(self, key):
+        """
+        Insert 'key' into the AVL Tree and rebalance if needed.
+        """
+        keys, left, right, height = self.keys, self.left, self.right, self.height
+        node = self.root
+        stack = []
+
+        # Normal BST descent, remembering the path
+        while node >= 0:
+            went_left = key < keys[node]
+            stack.append((node, went_left))
+            node = left[node] if went_left else right[node]
+        node = self._alloc(key)
+
+        child_went_left = None
+        while stack:
+            parent, went_left = stack.pop()
+            if went_left:
+                left[parent] = node
+            else:
+                right[parent] = node
+
+            # Update height and balance from one load of each child height
+            old_height = height[parent]
+            l, r = left[parent], right[parent]
+            hl = 0 if l < 0 else height[l]
+            hr = 0 if r < 0 else height[r]
+            height[parent] = 1 + (hl if hl > hr else hr)
+            balance = hl - hr
+
+            # Case 1: Left Left
+            if balance > 1 and child_went_left:
+                node = self._right_rotate(parent)
+            # Case 2: Right Right
+            elif balance < -1 and not child_went_left:
+                node = self._left_rotate(parent)
+            # Case 3: Left Right
+            elif balance > 1:
+                left[parent] = self._left_rotate(left[parent])
+                node = self._right_rotate(parent)
+            # Case 4: Right Left
+            elif balance < -1:
+                right[parent] = self._right_rotate(right[parent])
+                node = self._left_rotate(parent)
+            else:
+                node = parent
+                if height[parent] == old_height:
+                    return
+
+            child_went_left = went_left
+
+        self.root = node
+
+    def bulk_load(self, keys):
+        """
+        Replace the tree's contents with 'keys', building a perfectly balanced
+        tree after sorting. Node ids follow sorted order, so node i holds the
+        i-th smallest key; a subtree over s keys has height s.bit_length().
+        """
+        self.keys = keys = array('q', sorted(keys))
+        n = len(keys)
+        self.left = array('i', [NIL]) * n
+        self.right = array('i', [NIL]) * n
+        self.height = array('b', [0]) * n
+        self._free = []
+        left, right, height = self.left, self.right, self.height
+
+        root = NIL
+        # Explicit stack of (lo, hi, parent, is_left) key ranges still to build
+        stack = [(0, n, NIL, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            if lo >= hi:
+                continue
+            node = mid = (lo + hi) >> 1
+            height[node] = (hi - lo).bit_length()
+            if parent == NIL:
+                root = node
+            elif is_left:
+                left[parent] = node
+            else:
+                right[parent] = node
+            stack.append((lo, mid, node, True))
+            stack.append((mid + 1, hi, node, False))
+        self.root = root
+
+    def search(self, key):
+        """
+        Return True if 'key' exists in the AVL Tree, False otherwise.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while node >= 0:
+            k = keys[node]
+            if k == key:
+                return True
+            node = left[node] if key < k else right[node]
+        return False
+
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' exist in the tree, walking each one in
+        this loop instead of calling search() per query.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        root = self.root
+        count = 0
+        for key in queries:
+            node = root
+            while node >= 0:
+                k = keys[node]
+                if k == key:
+                    count += 1
+                    break
+                node = left[node] if key < k else right[node]
+        return count
+
+    def delete(self, key):
+        """
+        Delete 'key' from the AVL Tree if it exists.
+        """
+        keys, left, right, height = self.keys, self.left, self.right, self.height
+        node = self.root
+        stack = []
+
+        # 1) Perform BST delete
+        while node >= 0 and keys[node] != key:
+            went_left = key < keys[node]
+            stack.append((node, went_left))
+            node = left[node] if went_left else right[node]
+
+        if node < 0:
+            # Key not found
+            return
+
+        if left[node] >= 0 and right[node] >= 0:
+            # Two children: copy the inorder successor's key, then remove the successor
+            stack.append((node, False))
+            temp = right[node]
+            while left[temp] >= 0:
+                stack.append((temp, True))
+                temp = left[temp]
+            keys[node] = keys[temp]
+            node = temp
+
+        removed = node
+        node = left[node] if left[node] >= 0 else right[node]
+        self._release(removed)
+
+        while stack:
+            parent, went_left = stack.pop()
+            if went_left:
+                left[parent] = node
+            else:
+                right[parent] = node
+
+            # 2) Update height of current node
+            old_height = height[parent]
+            l, r = left[parent], right[parent]
+            hl = 0 if l < 0 else height[l]
+            hr = 0 if r < 0 else height[r]
+            height[parent] = 1 + (hl if hl > hr else hr)
+
+            # 3) Get the balance factor and rebalance if needed
+            balance = hl - hr
+
+            # Left Left
+            if balance > 1 and self._get_balance(left[parent]) >= 0:
+                node = self._right_rotate(parent)
+            # Left Right
+            elif balance > 1:
+                left[parent] = self._left_rotate(left[parent])
+                node = self._right_rotate(parent)
+            # Right Right
+            elif balance < -1 and self._get_balance(right[parent]) <= 0:
+                node = self._left_rotate(parent)
+            # Right Left
+            elif balance < -1:
+                right[parent] = self._right_rotate(right[parent])
+                node = self._left_rotate(parent)
+            else:
+                node = parent
+                if height[parent] == old_height:
+                    return
+
+        self.root = node
@@ -0,0 +1,380 @@
+"""
+References:
+1. Wikipedia: AVL Tree — https://en.wikipedia.org/wiki/AVL_tree
+2. Numba documentation — https://numba.readthedocs.io/
+
+Numba-compiled variant of AVL_Tree.py for int64 keys.
+The tree lives in preallocated NumPy arrays (keys, left, right, height) and
+every node is an integer index; index 0 is the NIL node with height 0, so
+height lookups need no None check. The core routines are @njit functions over
+those arrays, and NumbaAVLTree is a thin Python wrapper that owns the arrays
+and grows them (outside the compiled code) when they fill up.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+NIL = 0         # Index of the NIL node
+MAX_DEPTH = 64  # Path stack size; an AVL tree of height 64 needs > 10^13 nodes
+
+@njit(cache=True)
+def _update_height(left, right, height, i):
+    hl = height[left[i]]
+    hr = height[right[i]]
+    height[i] = 1 + (hl if hl > hr else hr)
+
+@njit(cache=True)
+def _balance(left, right, height, i):
+    return height[left[i]] - height[right[i]]
+
+@njit(cache=True)
+def _right_rotate(left, right, height, z):
+    """
+    Right-rotate around node z and return the new root of that subtree.
+    """
+    y = left[z]
+    left[z] = right[y]
+    right[y] = z
+    _update_height(left, right, height, z)
+    _update_height(left, right, height, y)
+    return y
+
+@njit(cache=True)
+def _left_rotate(left, right, height, z):
+    """
+    Left-rotate around node z and return the new root of that subtree.
+    """
+    y = right[z]
+    right[z] = left[y]
+    left[y] = z
+    _update_height(left, right, height, z)
+    _update_height(left, right, height, y)
+    return y
+
+@njit(cache=True)
+def _rebalance(left, right, height, i):
+    """
+    Apply whichever of the 4 rotation cases node 'i' needs and return the
+    new subtree root. The child's balance factor picks between the outside
+    (LL/RR) and inside (LR/RL) cases, which works for insert and delete alike.
+    """
+    balance = _balance(left, right, height, i)
+    if balance > 1:
+        if _balance(left, right, height, left[i]) < 0:
+            left[i] = _left_rotate(left, right, height, left[i])
+        return _right_rotate(left, right, height, i)
+    if balance < -1:
+        if _balance(left, right, height, right[i]) > 0:
+            right[i] = _right_rotate(left, right, height, right[i])
+        return _left_rotate(left, right, height, i)
+    return i
+
+@njit(cache=True)
+def avl_insert(keys, left, right, height, root, key, new_id):
+    """
+    Insert 'key' into the tree rooted at 'root', storing it in the free slot
+    'new_id'. Returns the new root.
+    """
+    path = np.empty(MAX_DEPTH, dtype=np.int64)
+    went_left = np.empty(MAX_DEPTH, dtype=np.bool_)
+    depth = 0
+    node = root
+    while node != NIL:
+        path[depth] = node
+        went_left[depth] = key < keys[node]
+        node = left[node] if went_left[depth] else right[node]
+        depth += 1
+
+    keys[new_id] = key
+    left[new_id] = NIL
+    right[new_id] = NIL
+    height[new_id] = 1
+    node = new_id
+
+    while depth > 0:
+        depth -= 1
+        parent = path[depth]
+        if went_left[depth]:
+            left[parent] = node
+        else:
+            right[parent] = node
+        old_height = height[parent]
+        _update_height(left, right, height, parent)
+        node = _rebalance(left, right, height, parent)
+        if node == parent and height[parent] == old_height:
+            # Subtree height unchanged: no ancestor above can be affected
+            return root
+    return node
+
+@njit(cache=True)
+def avl_search(keys, left, right, root, key):
+    """
+    Return True if 'key' exists in the tree rooted at 'root'.
+    """
+    node = root
+    while node != NIL:
+        k = keys[node]
+        if k == key:
+            return True
+        node = left[node] if key < k else right[node]
+    return False
+
+@njit(parallel=True, cache=True)
+def avl_search_batch(keys, left, right, root, queries):
+    """
+    Search every key in 'queries' (in parallel across cores) and return a
+    boolean mask of which ones exist.
+    """
+    out = np.empty(queries.shape[0], dtype=np.bool_)
+    for i in prange(queries.shape[0]):
+        out[i] = avl_search(keys, left, right, root, queries[i])
+    return out
+
+@njit(cache=True)
+def avl_insert_batch(keys, left, right, height, root, batch, ids):
+    """
+    Insert every key of 'batch' in order, batch[i] going into the free slot
+    ids[i], in one compiled loop. Returns the new root.
+    """
+    for i in range(batch.shape[0]):
+        root = avl_insert(keys, left, right, height, root, batch[i], ids[i])
+    return root
+
+@njit(cache=True)
+def avl_delete_batch(keys, left, right, height, root, batch):
+    """
+    Delete one occurrence of every key of 'batch' in order, in one compiled
+    loop. Returns (new_root, removed), where removed[i] is the slot freed by
+    batch[i] (NIL if it was absent).
+    """
+    removed = np.empty(batch.shape[0], dtype=np.int64)
+    for i in range(batch.shape[0]):
+        root, removed[i] = avl_delete(keys, left, right, height, root, batch[i])
+    return root, removed
+
+@njit(cache=True)
+def avl_delete(keys, left, right, height, root, key):
+    """
+    Delete one occurrence of 'key' from the tree rooted at 'root'.
+    Returns (new_root, removed_id), where removed_id is NIL if 'key' was absent.
+    """
+    path = np.empty(MAX_DEPTH, dtype=np.int64)
+    went_left = np.empty(MAX_DEPTH, dtype=np.bool_)
+    depth = 0
+    node = root
+    while node != NIL and keys[node] != key:
+        path[depth] = node
+        went_left[depth] = key < keys[node]
+        node = left[node] if went_left[depth] else right[node]
+        depth += 1
+
+    if node == NIL:
+        return root, NIL
+
+    if left[node] != NIL and right[node] != NIL:
+        # Two children: copy the inorder successor's key, then remove the successor
+        path[depth] = node
+        went_left[depth] = False
+        depth += 1
+        temp = right[node]
+        while left[temp] != NIL:
+            path[depth] = temp
+            went_left[depth] = True
+            depth += 1
+            temp = left[temp]
+        keys[node] = keys[temp]
+        node = temp
+
+    removed = node
+    node = left[node] if left[node] != NIL else right[node]
+
+    while depth > 0:
+        depth -= 1
+        parent = path[depth]
+        if went_left[depth]:
+            left[parent] = node
+        else:
+            right[parent] = node
+        old_height = height[parent]
+        _update_height(left, right, height, parent)
+        node = _rebalance(left, right, height, parent)
+        if node == parent and height[parent] == old_height:
+            return root, removed
+    return node, removed
+
+@njit(cache=True)
+def avl_bulk_load(sorted_keys, keys, left, right, height):
+    """
+    Build a perfectly balanced tree over 'sorted_keys' into the node arrays,
+    using node id i + 1 for the i-th smallest key. Returns the root.
+    """
+    n = sorted_keys.shape[0]
+    for i in range(n):
+        keys[i + 1] = sorted_keys[i]
+        left[i + 1] = NIL
+        right[i + 1] = NIL
+
+    # Explicit stack of (lo, hi, parent, is_left) key ranges still to build;
+    # each pop pushes two ranges one level deeper, so 2 * MAX_DEPTH slots suffice
+    lo_stack = np.empty(2 * MAX_DEPTH, dtype=np.int64)
+    hi_stack = np.empty(2 * MAX_DEPTH, dtype=np.int64)
+    parent_stack = np.empty(2 * MAX_DEPTH, dtype=np.int64)
+    left_stack = np.empty(2 * MAX_DEPTH, dtype=np.bool_)
+    lo_stack[0] = 0
+    hi_stack[0] = n
+    parent_stack[0] = NIL
+    left_stack[0] = False
+    top = 1
+    root = NIL
+    while top > 0:
+        top -= 1
+        lo = lo_stack[top]
+        hi = hi_stack[top]
+        parent = parent_stack[top]
+        is_left = left_stack[top]
+        if lo >= hi:
+            continue
+        mid = (lo + hi) >> 1
+        node = mid + 1
+        # A median-split subtree over s keys has height bit_length(s)
+        s = hi - lo
+        h = 0
+        while s:
+            h += 1
+            s >>= 1
+        height[node] = h
+        if parent == NIL:
+            root = node
+        elif is_left:
+            left[parent] = node
+        else:
+            right[parent] = node
+        lo_stack[top] = lo
+        hi_stack[top] = mid
+        parent_stack[top] = node
+        left_stack[top] = True
+        lo_stack[top + 1] = mid + 1
+        hi_stack[top + 1] = hi
+        parent_stack[top + 1] = node
+        left_stack[top + 1] = False
+        top += 2
+    return root
+
+class NumbaAVLTree:
+    """
+    An AVL Tree of int64 keys whose insert/search/delete run as Numba-compiled code.
+    """
+    def __init__(self, capacity=1024):
+        """
+        Preallocate room for 'capacity' nodes (plus the NIL node at index 0).
+        """
+        capacity += 1
+        self.keys = np.zeros(capacity, dtype=np.int64)
+        self.left = np.zeros(capacity, dtype=np.int64)
+        self.right = np.zeros(capacity, dtype=np.int64)
+        self.height = np.zeros(capacity, dtype=np.int64)
+        self.size = 1  # Next never-used slot; slot 0 is NIL
+        self._free = []
+        self.root = NIL
+
+    def _grow(self):
+        """
+        Double the capacity of every node array.
+        """
+        n = len(self.keys)
+        for name in ('keys', 'left', 'right', 'height'):
+            arr = getattr(self, name)
+            grown = np.zeros(2 * n, dtype=np.int64)
+            grown[:n] = arr
+            setattr(self, name, grown)
+
+    def _alloc(self):
+        if self._free:
+            return self._free.pop()
+        if self.size == len(self.keys):
+            self._grow()
+        self.size += 1
+        return self.size - 1
+
+    def _alloc_batch(self, n):
+        """
+        Return an int64 array of 'n' slot ids: released slots first, then
+        never-used ones (growing the arrays as needed).
+        """
+        free = self._free
+        reused = min(n, len(free))
+        ids = np.empty(n, dtype=np.int64)
+        ids[:reused] = free[len(free) - reused:]
+        del free[len(free) - reused:]
+        fresh = n - reused
+        while self.size + fresh > len(self.keys):
+            self._grow()
+        ids[reused:] = np.arange(self.size, self.size + fresh)
+        self.size += fresh
+        return ids
+
+    def bulk_load(self, keys):
+        """
+        Replace the tree's contents with 'keys', building a perfectly balanced
+        tree with a single compiled pass after sorting.
+        """
+        sorted_keys = np.sort(np.asarray(keys, dtype=np.int64))
+        n = len(sorted_keys)
+        while len(self.keys) < n + 1:
+            self._grow()
+        self.size = n + 1
+        self._free = []
+        self.root = avl_bulk_load(sorted_keys, self.keys, self.left, self.right, self.height)
+
+    def insert(self, key):
+        """
+        Insert 'key' into the AVL Tree and rebalance if needed.
+        """
+        new_id = self._alloc()
+        self.root = avl_insert(self.keys, self.left, self.right, self.height, self.root, key, new_id)
+
+    def search(self, key):
+        """
+        Return True if 'key' exists in the AVL Tree, False otherwise.
+        """
+        return avl_search(self.keys, self.left, self.right, self.root, key)
+
+    def search_batch(self, queries):
+        """
+        Return a boolean NumPy mask of which 'queries' exist, answering them
+        all in one compiled call instead of one Python call per key.
+        """
+        queries = np.asarray(queries, dtype=np.int64)
+        return avl_search_batch(self.keys, self.left, self.right, self.root, queries)
+
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' exist (see search_batch).
+        """
+        return int(self.search_batch(queries).sum())
+
+    def delete(self, key):
+        """
+        Delete 'key' from the AVL Tree if it exists.
+        """
+        self.root, removed = avl_delete(self.keys, self.left, self.right, self.height, self.root, key)
+        if removed != NIL:
+            self._free.append(removed)
+
+    def insert_batch(self, keys):
+        """
+        Insert every key of 'keys' in order with one compiled call, the same
+        as calling insert() on each but without a Python call per key.
+        """
+        batch = np.asarray(keys, dtype=np.int64)
+        ids = self._alloc_batch(len(batch))
+        self.root = avl_insert_batch(self.keys, self.left, self.right, self.height, self.root, batch, ids)
+
+    def delete_batch(self, keys):
+        """
+        Delete one occurrence of every key of 'keys' in order with one
+        compiled call, the same as calling delete() on each.
+        """
+        batch = np.asarray(keys, dtype=np.int64)
+        self.root, removed = avl_delete_batch(self.keys, self.left, self.right, self.height, self.root, batch)
+        self._free.extend(removed[removed != NIL].tolist())
@@ -0,0 +1,188 @@
+"""
+References:
+1. Wikipedia: B-tree — https://en.wikipedia.org/wiki/B-tree
+2. Cormen, Leiserson, Rivest, Stein: Introduction to Algorithms, Chapter 18 (B-Trees)
+"""
+
+from bisect import bisect_left, bisect_right
+
+class BTreeNode:
+    """
+    A node in the B-Tree.
+
+    Attributes:
+        keys: Sorted Python list of the keys stored in this node.
+        children: List of child nodes (len(keys) + 1 of them), empty for a leaf.
+    """
+    __slots__ = ('keys', 'children')
+
+    def __init__(self, keys=None, children=None):
+        self.keys = keys if keys is not None else []
+        self.children = children if children is not None else []
+
+class BTree:
+    """
+    A B-Tree of minimum degree t: every node except the root holds between
+    t - 1 and 2t - 1 keys, so with t = 32 a million keys fit in 4 levels.
+    Each level costs one bisect over a contiguous list instead of one node
+    hop per comparison. Insert splits full nodes and delete refills minimal
+    nodes on the way down (CLRS), so both finish in a single downward pass.
+    Duplicate keys are allowed; delete removes one occurrence.
+    """
+
+    def __init__(self, t=32):
+        """
+        Initialize an empty B-Tree of minimum degree 't' (t >= 2).
+        """
+        self.t = t
+        self.root = BTreeNode()
+
+    def search(self, key):
+        """
+        Return True if 'key' exists in the B-Tree, False otherwise.
+        """
+        node = self.root
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                return True
+            if not node.children:
+                return False
+            node = node.children[i]
+
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' exist in the B-Tree, walking each one in
+        this loop instead of calling search() per query.
+        """
+        root = self.root
+        count = 0
+        for key in queries:
+            node = root
+            while True:
+                keys = node.keys
+                i = bisect_left(keys, key)
+                if i < len(keys) and keys[i] == key:
+                    count += 1
+                    break
+                if not node.children:
+                    break
+                node = node.children[i]
+        return count
+
+    def _split_child(self, parent, i):
+        """
+        Split the full child parent.children[i] around its median key, which
+        moves up into 'parent' between the two halves.
+        """
+        child = parent.children[i]
+        mid = self.t - 1
+        right = BTreeNode(child.keys[mid + 1:], child.children[mid + 1:])
+        parent.keys.insert(i, child.keys[mid])
+        parent.children.insert(i + 1, right)
+        del child.keys[mid:]
+        del child.children[mid + 1:]
+
+    def insert(self, key):
+        """
+        Insert 'key' into the B-Tree, splitting full nodes on the way down.
+        """
+        full = 2 * self.t - 1
+        node = self.root
+        if len(node.keys) == full:
+            # Grow in height: the old root becomes the only child of a new root
+            node = self.root = BTreeNode(children=[node])
+            self._split_child(node, 0)
+
+        while node.children:
+            i = bisect_right(node.keys, key)
+            if len(node.children[i].keys) == full:
+                self._split_child(node, i)
+                # The median moved up to keys[i]; equal keys go to its right
+                if key >= node.keys[i]:
+                    i += 1
+            node = node.children[i]
+        node.keys.insert(bisect_right(node.keys, key), key)
+
+    def delete(self, key):
+        """
+        Delete one occurrence of 'key' from the B-Tree if it exists.
+        Before descending into a child with only t - 1 keys, the child first
+        borrows a key from a sibling or is merged with one, so removing a key
+        from a leaf never underflows it.
+        """
+        t = self.t
+        node = self.root
+        while True:
+            keys, children = node.keys, node.children
+            i = bisect_left(keys, key)
+            found = i < len(keys) and keys[i] == key
+
+            if not children:
+                if found:
+                    del keys[i]
+                break
+
+            if found:
+                left, right = children[i], children[i + 1]
+                if len(left.keys) >= t:
+                    # Replace with the predecessor, then delete that from the left subtree
+                    pred = left
+                    while pred.children:
+                        pred = pred.children[-1]
+                    key = keys[i] = pred.keys[-1]
+                    node = left
+                elif len(right.keys) >= t:
+                    # Replace with the successor, then delete that from the right subtree
+                    succ = right
+                    while succ.children:
+                        succ = succ.children[0]
+                    key = keys[i] = succ.keys[0]
+                    node = right
+                else:
+                    # Both neighbours are minimal: merge them around the key and recurse
+                    left.keys.append(keys.pop(i))
+                    left.keys.extend(right.keys)
+                    left.children.extend(right.children)
+                    del children[i + 1]
+                    node = left
+                continue
+
+            child = children[i]
+            if len(child.keys) < t:
+                if i > 0 and len(children[i - 1].keys) >= t:
+                    # Borrow through the parent from the left sibling
+                    sib = children[i - 1]
+                    child.keys.insert(0, keys[i - 1])
+                    keys[i - 1] = sib.keys.pop()
+                    if sib.children:
+                        child.children.insert(0, sib.children.pop())
+                elif i < len(keys) and len(children[i + 1].keys) >= t:
+                    # Borrow through the parent from the right sibling
+                    sib = children[i + 1]
+                    child.keys.append(keys[i])
+                    keys[i] = sib.keys.pop(0)
+                    if sib.children:
+                        child.children.append(sib.children.pop(0))
+                elif i < len(keys):
+                    # Merge with the right sibling
+                    sib = children[i + 1]
+                    child.keys.append(keys.pop(i))
+                    child.keys.extend(sib.keys)
+                    child.children.extend(sib.children)
+                    del children[i + 1]
+                else:
+                    # Merge into the left sibling
+                    sib = children[i - 1]
+                    sib.keys.append(keys.pop(i - 1))
+                    sib.keys.extend(child.keys)
+                    sib.children.extend(child.children)
+                    del children[i]
+                    child = sib
+            node = child
+
+        root = self.root
+        if not root.keys and root.children:
+            # Shrink in height
+            self.root = root.children[0]
@@ -4,9 +4,19 @@ References:
 2. GeeksforGeeks: Various articles on BST and self-balancing trees
 """
 
+from array import array
+
+from AVL_Tree import eytzinger_fill, eytzinger_search
+
 RED = True
 BLACK = False
 
+try:
+    from _rbtree_core import (CRBNode, search as _c_search, search_count as _c_search_count,
+                              insert as _c_insert, delete as _c_delete)
+except ImportError:  # extension not built (python setup.py build_ext --inplace)
+    CRBNode = None
+
 class RBNode:
     """
     A node in the Red-Black Tree.
@@ -14,298 +24,442 @@ class RBNode:
     Attributes:
         key: The key stored in this node.
         color: RED (True) or BLACK (False).
-        left, right, parent: Child and parent references.
+        left, right: Child references (None for an empty subtree, which counts as BLACK).
+
+    Nodes keep no parent pointer; insert and delete record the root-to-node
+    path on a stack and the fix-up routines walk back up that stack instead.
     """
-    def __init__(self, key, color=RED, left=None, right=None, parent=None):
+    __slots__ = ('key', 'color', 'left', 'right')
+
+    def __init__(self, key, color=RED, left=None, right=None):
         self.key = key
         self.color = color
         self.left = left
         self.right = right
-        self.parent = parent
 
 class RBTree:
     """
     A Red-Black Tree implementation supporting insertion, search, and deletion.
     """
+    _Node = RBNode  # Node class used for new nodes
+    _POOL_MAX = 1 << 16  # Cap on deleted nodes kept for reuse
 
     def __init__(self):
         """
-        Initialize an empty RBTree with a sentinel NIL node (BLACK).
+        Initialize an empty RBTree. Empty subtrees are None rather than a
+        shared sentinel node, so the fix-ups test 'is not None' before
+        reading a possibly missing child's color.
+        """
+        self.root = None
+        self._mru = [None] * 4  # Recent (key, found) search results, slot = hash(key) & 3
+        self._pool = []  # Nodes unlinked by delete, reused by _new_node
+        self._frozen = None  # Eytzinger snapshot built by freeze()
+
+    def _new_node(self, key):
+        """
+        Return a RED leaf node holding 'key', reusing a pooled node when available.
+        """
+        pool = self._pool
+        if pool:
+            node = pool.pop()
+            node.key = key
+            node.color = RED
+            return node
+        return self._Node(key=key, color=RED)
+
+    def _release(self, node):
+        """
+        Drop the links of a node that has been unlinked from the tree and
+        return it to the pool (the key is overwritten on reuse).
         """
-        self.NIL = RBNode(key=None, color=BLACK)
-        self.root = self.NIL
+        if len(self._pool) < self._POOL_MAX:
+            node.left = node.right = None
+            self._pool.append(node)
 
     def insert(self, key):
         """
         Insert a 'key' into the Red-Black Tree.
 
         Steps:
-        1. Perform a standard BST insert.
+        1. Perform a standard BST insert, recording the path of ancestors.
         2. Assign the new node color = RED.
         3. Call _fix_insert to restore Red-Black invariants if violated.
         """
-        new_node = RBNode(key=key, color=RED, left=self.NIL, right=self.NIL)
-        parent = None
+        self._mru[hash(key) & 3] = None
+        self._frozen = None
+        new_node = self._new_node(key)
+        stack = []
         current = self.root
 
         # 1. BST insert to find position
-        while current != self.NIL:
-            parent = current
-            if new_node.key < current.key:
-                current = current.left
-            else:
-                current = current.right
+        went_left = False
+        while current is not None:
+            stack.append(current)
+            went_left = key < current.key
+            current = current.left if went_left else current.right
 
-        new_node.parent = parent
-        if not parent:
+        if not stack:
             # Tree is empty, new_node becomes root
+            new_node.color = BLACK
             self.root = new_node
-        elif new_node.key < parent.key:
+            return
+
+        parent = stack[-1]
+        if went_left:
             parent.left = new_node
         else:
             parent.right = new_node
-        
-        # If new_node is now the root
-        if new_node.parent is None:
-            new_node.color = BLACK
-            return
 
-        # If grandparent doesn't exist, no need to fix
-        if new_node.parent.parent is None:
-            return
-        
-        # 2. Fix potential Red-Black violations
-        self._fix_insert(new_node)
+        # 2. Fix potential Red-Black violations. A BLACK parent (which covers a
+        # parent that is the root) leaves nothing to fix.
+        if parent.color == RED:
+            self._fix_insert(new_node, stack)
 
-    def _fix_insert(self, node):
+    def _fix_insert(self, node, stack):
         """
         Restore Red-Black properties after inserting 'node'.
-        Cases:
+        'stack' holds the ancestors of 'node' from the root down to its parent.
+        Each step finds the parent's side d (0 = left child, 1 = right child),
+        packs (uncle is RED, node is outside child) into a 2-bit index and runs
+        the matching entry of _INSERT_ACTIONS, which handles both sides via d:
             1. Uncle is RED -> recolor parent, uncle, grandparent
             2. Uncle is BLACK + node is inside child (LR or RL) -> rotate
             3. Uncle is BLACK + node is outside child (LL or RR) -> rotate & recolor
         """
-        while node.parent.color == RED:
-            if node.parent == node.parent.parent.left:
-                uncle = node.parent.parent.right
-                # Case 1: Uncle is red
-                if uncle.color == RED:
-                    node.parent.color = BLACK
-                    uncle.color = BLACK
-                    node.parent.parent.color = RED
-                    node = node.parent.parent
-                else:
-                    # Case 2 or 3
-                    if node == node.parent.right:
-                        node = node.parent
-                        self._left_rotate(node)
-                    node.parent.color = BLACK
-                    node.parent.parent.color = RED
-                    self._right_rotate(node.parent.parent)
-            else:
-                # Mirror cases if parent is a right child
-                uncle = node.parent.parent.left
-                if uncle.color == RED:
-                    node.parent.color = BLACK
-                    uncle.color = BLACK
-                    node.parent.parent.color = RED
-                    node = node.parent.parent
-                else:
-                    if node == node.parent.left:
-                        node = node.parent
-                        self._right_rotate(node)
-                    node.parent.color = BLACK
-                    node.parent.parent.color = RED
-                    self._left_rotate(node.parent.parent)
-            
-            if node == self.root:
+        while stack:
+            p = stack.pop()
+            if p.color == BLACK:
+                break
+            # A red parent is never the root, so the grandparent exists
+            gp = stack.pop()
+            pair = (gp.left, gp.right)
+            d = p is pair[1]
+            uncle = pair[1 - d]
+            idx = ((uncle is not None and uncle.color) << 1) | (node is (p.left, p.right)[d])
+            node = _INSERT_ACTIONS[idx](self, node, p, gp, stack[-1] if stack else None, d)
+            if node is None:
                 break
         self.root.color = BLACK
 
-    def _left_rotate(self, x):
+    def _replace_child(self, parent, old, new):
         """
-        Left-rotate around node x.
-        x becomes left child of its right child y.
+        Make 'new' take the place of 'parent's child 'old' (or of the root if parent is None).
         """
-        y = x.right
-        x.right = y.left
-        if y.left != self.NIL:
-            y.left.parent = x
-        y.parent = x.parent
-        if x.parent is None:
-            self.root = y
-        elif x == x.parent.left:
-            x.parent.left = y
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
         else:
-            x.parent.right = y
-        y.left = x
-        x.parent = y
+            parent.right = new
 
-    def _right_rotate(self, x):
+    def _rotate(self, x, parent, d):
         """
-        Right-rotate around node x.
-        x becomes right child of its left child y.
+        Rotate around node x, whose parent is 'parent' (None for the root), moving
+        x down to side d: d = 0 is a left rotation, d = 1 a right rotation.
+        x becomes the d-side child of its opposite-side child y. Returns y.
         """
-        y = x.left
-        x.left = y.right
-        if y.right != self.NIL:
-            y.right.parent = x
-        y.parent = x.parent
-        if x.parent is None:
+        if d:
+            y = x.left
+            x.left = y.right
+            y.right = x
+        else:
+            y = x.right
+            x.right = y.left
+            y.left = x
+        if parent is None:
             self.root = y
-        elif x == x.parent.right:
-            x.parent.right = y
+        elif parent.left is x:
+            parent.left = y
         else:
-            x.parent.left = y
-        y.right = x
-        x.parent = y
+            parent.right = y
+        return y
+
+    def bulk_load(self, keys):
+        """
+        Replace the tree's contents with 'keys', building a perfectly balanced
+        tree after sorting: each subtree root is the median of its key range,
+        so no fix-ups are needed. Such a tree over n keys has every empty
+        subtree at depth d or d + 1, with d = n.bit_length() - 1; coloring
+        exactly the nodes at depth d RED gives every root-to-leaf path d BLACK nodes.
+        """
+        keys = sorted(keys)
+        self._mru = [None] * 4
+        self._frozen = None
+        Node = self._Node
+        red_depth = len(keys).bit_length() - 1
+
+        root = None
+        # Explicit stack of (lo, hi, parent, is_left, depth) key ranges still to build
+        stack = [(0, len(keys), None, False, 0)]
+        while stack:
+            lo, hi, parent, is_left, depth = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) >> 1
+            node = Node(key=keys[mid], color=depth == red_depth)
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((lo, mid, node, True, depth + 1))
+            stack.append((mid + 1, hi, node, False, depth + 1))
+        if root is not None:
+            root.color = BLACK
+        self.root = root
 
     def search(self, key):
         """
         Return True if 'key' is found in the tree, else False.
+        Checks the 4-slot cache of recent results first (see AVLTree.search).
+        """
+        slot = hash(key) & 3
+        hit = self._mru[slot]
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        found = self._search_helper(self.root, key)
+        self._mru[slot] = (key, found)
+        return found
+
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' exist in the tree, walking each one in
+        this loop instead of calling search() per query (no result cache).
         """
-        return self._search_helper(self.root, key)
+        root = self.root
+        count = 0
+        for key in queries:
+            node = root
+            while node is not None:
+                k = node.key
+                if k == key:
+                    count += 1
+                    break
+                node = node.left if key < k else node.right
+        return count
 
     def _search_helper(self, node, key):
-        if node == self.NIL:
-            return False
-        if node.key == key:
-            return True
-        elif key < node.key:
-            return self._search_helper(node.left, key)
-        else:
-            return self._search_helper(node.right, key)
+        while node is not None:
+            k = node.key
+            if k == key:
+                return True
+            node = node.left if key < k else node.right
+        return False
+
+    def freeze(self):
+        """
+        Snapshot the keys into an Eytzinger-ordered array('q') for read-only
+        lookups (see AVLTree.freeze). Any insert/delete discards the snapshot.
+        """
+        keys = []
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            keys.append(node.key)
+            node = node.right
+        a = array('q', bytes(8 * (len(keys) + 1)))  # slot 0 is unused
+        self._frozen = eytzinger_fill(keys, a)
+        return a
+
+    def search_frozen(self, key):
+        """
+        Return True if 'key' exists, using the Eytzinger snapshot (built on demand).
+        """
+        a = self._frozen
+        if a is None:
+            a = self.freeze()
+        return eytzinger_search(a, key)
 
     def delete(self, key):
         """
         Delete the node with the given 'key' if it exists in the RBTree.
 
         Steps:
-        1. BST find the node (z).
-        2. If not found (z == NIL), do nothing.
-        3. Perform standard BST deletion but track the original color.
-        4. If original color was BLACK, call _fix_delete to restore invariants.
+        1. BST find the node (z), recording the path of ancestors.
+        2. If not found (z is None), do nothing.
+        3. If z has two children, move its successor's key into z and remove
+           the successor instead, so the removed node has at most one child.
+        4. If the removed node was BLACK, call _fix_delete to restore invariants.
         """
+        self._mru[hash(key) & 3] = None
+        self._frozen = None
         self._delete_helper(self.root, key)
 
     def _delete_helper(self, node, key):
         """
         Finds the node with 'key' and deletes it, then calls _fix_delete if needed.
         """
-        z = self.NIL
+        stack = []
         # 1. BST search to locate node z
-        while node != self.NIL:
-            if node.key == key:
-                z = node
-            if key < node.key:
-                node = node.left
-            else:
-                node = node.right
+        while node is not None:
+            k = node.key
+            if k == key:
+                break
+            stack.append(node)
+            node = node.left if key < k else node.right
 
-        if z == self.NIL:
+        if node is None:
             # Key not found
             return
 
-        # y is the node we'll actually remove or move
-        y = z
-        y_original_color = y.color
-        if z.left == self.NIL:
-            x = z.right
-            self._rb_transplant(z, z.right)
-        elif z.right == self.NIL:
-            x = z.left
-            self._rb_transplant(z, z.left)
-        else:
-            # Find successor (minimum of z.right)
-            y = self._minimum(z.right)
-            y_original_color = y.color
-            x = y.right
-            if y.parent == z:
-                x.parent = y
-            else:
-                self._rb_transplant(y, y.right)
-                y.right = z.right
-                y.right.parent = y
-            self._rb_transplant(z, y)
-            y.left = z.left
-            y.left.parent = y
-            # Copy color of z into successor to preserve black-height
-            y.color = z.color
-
-        if y_original_color == BLACK:
-            self._fix_delete(x)
-
-    def _rb_transplant(self, u, v):
-        """
-        Replace subtree rooted at u with subtree rooted at v.
-        """
-        if u.parent is None:
-            self.root = v
-        elif u == u.parent.left:
-            u.parent.left = v
-        else:
-            u.parent.right = v
-        v.parent = u.parent
+        z = node
+        zl, zr = z.left, z.right
+        if zl is not None and zr is not None:
+            # Find successor (minimum of z.right) and splice it out in place of z
+            stack.append(z)
+            y = zr
+            yl = y.left
+            while yl is not None:
+                stack.append(y)
+                y = yl
+                yl = y.left
+            z.key = y.key
+            z = y
+            zl, zr = yl, y.right
 
-    def _fix_delete(self, x):
+        # z has at most one child, x, which takes its place
+        x = zr if zl is None else zl
+        self._replace_child(stack[-1] if stack else None, z, x)
+
+        if z.color == BLACK:
+            self._fix_delete(x, stack)
+        self._release(z)
+
+    def _fix_delete(self, x, stack):
         """
         Restore Red-Black invariants after a delete operation
         potentially removed a BLACK node (or replaced it).
+        'stack' holds the ancestors of 'x' from the root down to its parent.
+        Each step finds x's side d (0 = left child, 1 = right child), packs
+        (sibling is RED, far nephew is RED, near nephew is RED) into a 3-bit
+        index and runs the matching entry of _DELETE_ACTIONS, which returns the
+        next 'x' (and empties 'stack' once the tree is valid). x may be None.
         """
-        while x != self.root and x.color == BLACK:
-            if x == x.parent.left:
-                sib = x.parent.right
-                # Case 1: sibling is RED
-                if sib.color == RED:
-                    sib.color = BLACK
-                    x.parent.color = RED
-                    self._left_rotate(x.parent)
-                    sib = x.parent.right
-                # Case 2: sibling is BLACK, both children black
-                if sib.left.color == BLACK and sib.right.color == BLACK:
-                    sib.color = RED
-                    x = x.parent
-                else:
-                    # Case 3: sibling is black, left child is red, right child is black
-                    if sib.right.color == BLACK:
-                        sib.left.color = BLACK
-                        sib.color = RED
-                        self._right_rotate(sib)
-                        sib = x.parent.right
-                    # Case 4: sibling is black, right child is red
-                    sib.color = x.parent.color
-                    x.parent.color = BLACK
-                    sib.right.color = BLACK
-                    self._left_rotate(x.parent)
-                    x = self.root
-            else:
-                # Mirror logic if x is a right child
-                sib = x.parent.left
-                if sib.color == RED:
-                    sib.color = BLACK
-                    x.parent.color = RED
-                    self._right_rotate(x.parent)
-                    sib = x.parent.left
-                if sib.right.color == BLACK and sib.left.color == BLACK:
-                    sib.color = RED
-                    x = x.parent
-                else:
-                    if sib.left.color == BLACK:
-                        sib.right.color = BLACK
-                        sib.color = RED
-                        self._left_rotate(sib)
-                        sib = x.parent.left
-                    sib.color = x.parent.color
-                    x.parent.color = BLACK
-                    sib.left.color = BLACK
-                    self._right_rotate(x.parent)
-                    x = self.root
-        x.color = BLACK
-
-    def _minimum(self, node):
-        """
-        Return the node with the smallest key in the subtree rooted at 'node'.
-        """
-        while node.left != self.NIL:
-            node = node.left
-        return node
+        while stack and (x is None or x.color == BLACK):
+            xp = stack[-1]
+            # The removed node was BLACK, so x's sibling is never None and
+            # the identity test below is unambiguous even when x is None
+            pair = (xp.left, xp.right)
+            d = x is pair[1]
+            sib = pair[1 - d]
+            near, far = (sib.right, sib.left) if d else (sib.left, sib.right)
+            idx = ((sib.color << 2) | ((far is not None and far.color) << 1)
+                   | (near is not None and near.color))
+            x = _DELETE_ACTIONS[idx](self, x, sib, stack, d)
+        if x is not None:
+            x.color = BLACK
+
+
+class CRBTree(RBTree):
+    """
+    RBTree over int64 keys built from the Cython CRBNode, with insert, search
+    and delete running in the compiled _rbtree_core extension. bulk_load,
+    freeze and the search cache are inherited.
+    """
+    _Node = CRBNode
+
+    def __init__(self):
+        if CRBNode is None:
+            raise ImportError("_rbtree_core is not built; run: python setup.py build_ext --inplace")
+        super().__init__()
+
+    def insert(self, key):
+        """
+        Insert a 'key' into the Red-Black Tree (compiled).
+        """
+        self._mru[hash(key) & 3] = None
+        self._frozen = None
+        self.root = _c_insert(self.root, key)
+
+    def delete(self, key):
+        """
+        Delete the node with the given 'key' if it exists (compiled).
+        """
+        self._mru[hash(key) & 3] = None
+        self._frozen = None
+        self.root = _c_delete(self.root, key)
+
+    def _search_helper(self, node, key):
+        return _c_search(node, key)
+
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' exist in the tree (compiled).
+        """
+        return _c_search_count(self.root, queries)
+
+
+# ---------------------- Fix-up actions ----------------------
+# Insert actions take (tree, node, parent, grandparent, great-grandparent or None,
+# d = side of the parent under the grandparent) and return the node to continue
+# from, or None once the tree is valid.
+
+def _insert_recolor(tree, node, p, gp, ggp, d):
+    """Case 1: uncle is RED -> push the red violation up to the grandparent."""
+    p.color = BLACK
+    (gp.left if d else gp.right).color = BLACK
+    gp.color = RED
+    return gp
+
+def _insert_rot_outside(tree, node, p, gp, ggp, d):
+    """Case 3 (LL/RR): rotate the grandparent away from the parent's side and recolor."""
+    p.color = BLACK
+    gp.color = RED
+    tree._rotate(gp, ggp, 1 - d)
+    return None
+
+def _insert_rot_inside(tree, node, p, gp, ggp, d):
+    """Case 2 (LR/RL): rotate the parent toward its side, then finish as case 3."""
+    return _insert_rot_outside(tree, p, tree._rotate(p, gp, d), gp, ggp, d)
+
+# Index: (uncle is RED) << 1 | (node is outside child)
+_INSERT_ACTIONS = (
+    _insert_rot_inside, _insert_rot_outside, _insert_recolor, _insert_recolor,
+)
+
+# Delete actions take (tree, x, sibling, stack, d = side of x) where stack[-1]
+# is x's parent, and return the next x; once the tree is valid they empty 'stack'.
+
+def _delete_red_sibling(tree, x, sib, stack, d):
+    """Case 1: sibling is RED -> rotate it above the parent; x gets a BLACK sibling."""
+    xp = stack[-1]
+    sib.color = BLACK
+    xp.color = RED
+    tree._rotate(xp, stack[-2] if len(stack) > 1 else None, d)
+    # sib is now xp's parent
+    stack[-1] = sib
+    stack.append(xp)
+    return x
+
+def _delete_recolor(tree, x, sib, stack, d):
+    """Case 2: sibling and both nephews are BLACK -> recolor and move up."""
+    sib.color = RED
+    return stack.pop()
+
+def _delete_far_red(tree, x, sib, stack, d):
+    """Case 4: far nephew is RED -> rotate the parent toward x and recolor."""
+    xp = stack[-1]
+    sib.color = xp.color
+    xp.color = BLACK
+    (sib.left if d else sib.right).color = BLACK
+    tree._rotate(xp, stack[-2] if len(stack) > 1 else None, d)
+    stack.clear()
+    return x
+
+def _delete_near_red(tree, x, sib, stack, d):
+    """Case 3: only the near nephew is RED -> rotate the sibling, then finish as case 4."""
+    sib.color = RED
+    (sib.right if d else sib.left).color = BLACK
+    sib = tree._rotate(sib, stack[-1], 1 - d)
+    return _delete_far_red(tree, x, sib, stack, d)
+
+# Index: (sibling is RED) << 2 | (far nephew is RED) << 1 | (near nephew is RED)
+_DELETE_ACTIONS = (
+    _delete_recolor, _delete_near_red, _delete_far_red, _delete_far_red,
+    _delete_red_sibling, _delete_red_sibling, _delete_red_sibling, _delete_red_sibling,
+)
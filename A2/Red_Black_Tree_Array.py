@@ -0,0 +1,341 @@
+"""
+References:
+1. Wikipedia: Red–black tree — https://en.wikipedia.org/wiki/Red–black_tree
+2. GeeksforGeeks: Various articles on BST and self-balancing trees
+
+Array-backed (struct-of-arrays) variant of Red_Black_Tree.py.
+Every node is an integer index into parallel arrays (keys, left, right,
+parent, color) that together form a node arena; deleted ids go on a free list
+and are reused by the next insert, so no per-node object is ever allocated.
+Index 0 is a shared BLACK sentinel standing in for every empty child (RBTree
+uses None for these).
+Unlike RBTree, which walks a recorded path stack, nodes here keep a parent
+link (one more int column), so the fix-ups follow the classic CLRS form.
+Keys are specialized to int64 and stored in an array('q'); inserting any other
+type (float, str, ...) raises TypeError.
+"""
+
+from array import array
+
+RED = 1
+BLACK = 0
+
+NIL = 0  # Index of the sentinel node
+
+class ArrayRBTree:
+    """
+    A Red-Black Tree stored as parallel arrays, supporting insertion, search, and deletion.
+
+    Attributes:
+        keys: array('q') of int64 keys, indexed by node id.
+        left, right, parent: array('i') of node ids (NIL if absent).
+        color: bytearray of RED (1) / BLACK (0).
+        root: Node id of the root (NIL if the tree is empty).
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty tree holding only the BLACK sentinel at index 0.
+        """
+        self.keys = array('q', [0])
+        self.left = array('i', [NIL])
+        self.right = array('i', [NIL])
+        self.parent = array('i', [NIL])
+        self.color = bytearray([BLACK])
+        self._free = []  # Node ids released by delete, reused by _new_node
+        self.root = NIL
+
+    def _new_node(self, key):
+        """
+        Allocate a RED node holding 'key' with NIL children and return its id.
+        """
+        if self._free:
+            i = self._free[-1]
+            self.keys[i] = key  # Raises TypeError for a non-int key before any change
+            self._free.pop()
+            self.left[i] = NIL
+            self.right[i] = NIL
+            self.parent[i] = NIL
+            self.color[i] = RED
+            return i
+        self.keys.append(key)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.parent.append(NIL)
+        self.color.append(RED)
+        return len(self.keys) - 1
+
+    def insert(self, key):
+        """
+        Insert a 'key' into the Red-Black Tree.
+
+        Steps:
+        1. Perform a standard BST insert.
+        2. Assign the new node color = RED.
+        3. Call _fix_insert to restore Red-Black invariants if violated.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        new_node = self._new_node(key)
+        parent = NIL
+        current = self.root
+
+        # 1. BST insert to find position
+        went_left = False
+        while current != NIL:
+            parent = current
+            went_left = key < keys[current]
+            current = left[current] if went_left else right[current]
+
+        self.parent[new_node] = parent
+        if parent == NIL:
+            # Tree is empty, new_node becomes root
+            self.root = new_node
+            self.color[new_node] = BLACK
+            return
+        elif went_left:
+            left[parent] = new_node
+        else:
+            right[parent] = new_node
+
+        # 2. Fix potential Red-Black violations (none if the parent is BLACK,
+        # which covers a parent that is the root)
+        if self.color[parent] == RED:
+            self._fix_insert(new_node)
+
+    def _fix_insert(self, node):
+        """
+        Restore Red-Black properties after inserting 'node'.
+        Both mirror sides share one code path: d is the parent's side under
+        the grandparent (0 = left, 1 = right) and child[d] is that side's array.
+        Cases:
+            1. Uncle is RED -> recolor parent, uncle, grandparent
+            2. Uncle is BLACK + node is inside child (LR or RL) -> rotate
+            3. Uncle is BLACK + node is outside child (LL or RR) -> rotate & recolor
+        """
+        parent, color = self.parent, self.color
+        child = (self.left, self.right)
+        while color[parent[node]] == RED:
+            p = parent[node]
+            gp = parent[p]
+            d = p == child[1][gp]
+            uncle = child[1 - d][gp]
+            # Case 1: Uncle is red
+            if color[uncle] == RED:
+                color[p] = BLACK
+                color[uncle] = BLACK
+                color[gp] = RED
+                node = gp
+            else:
+                # Case 2 or 3
+                if node == child[1 - d][p]:
+                    node = p
+                    self._rotate(node, d)
+                p = parent[node]
+                gp = parent[p]
+                color[p] = BLACK
+                color[gp] = RED
+                self._rotate(gp, 1 - d)
+
+            if node == self.root:
+                break
+        color[self.root] = BLACK
+
+    def _rotate(self, x, d):
+        """
+        Rotate around node x, moving x down to side d: d = 0 is a left
+        rotation, d = 1 a right rotation. x becomes the d-side child of its
+        opposite-side child y.
+        """
+        parent = self.parent
+        near, far = (self.left, self.right) if d == 0 else (self.right, self.left)
+        y = far[x]
+        far[x] = near[y]
+        if near[y] != NIL:
+            parent[near[y]] = x
+        xp = parent[x]
+        parent[y] = xp
+        if xp == NIL:
+            self.root = y
+        elif x == near[xp]:
+            near[xp] = y
+        else:
+            far[xp] = y
+        near[y] = x
+        parent[x] = y
+
+    def bulk_load(self, keys):
+        """
+        Replace the tree's contents with 'keys', building a perfectly balanced
+        tree after sorting (see RBTree.bulk_load for the coloring). Node ids
+        follow sorted order, so node i + 1 holds the i-th smallest key.
+        """
+        keys = sorted(keys)
+        n = len(keys)
+        self.keys = array('q', [0]) + array('q', keys)
+        self.left = array('i', [NIL]) * (n + 1)
+        self.right = array('i', [NIL]) * (n + 1)
+        self.parent = array('i', [NIL]) * (n + 1)
+        self.color = bytearray(n + 1)  # all BLACK
+        self._free = []
+        left, right, parent, color = self.left, self.right, self.parent, self.color
+        red_depth = n.bit_length() - 1
+
+        root = NIL
+        # Explicit stack of (lo, hi, parent, is_left, depth) key ranges still to build
+        stack = [(0, n, NIL, False, 0)]
+        while stack:
+            lo, hi, p, is_left, depth = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) >> 1
+            node = mid + 1
+            parent[node] = p
+            if depth == red_depth:
+                color[node] = RED
+            if p == NIL:
+                root = node
+            elif is_left:
+                left[p] = node
+            else:
+                right[p] = node
+            stack.append((lo, mid, node, True, depth + 1))
+            stack.append((mid + 1, hi, node, False, depth + 1))
+        color[root] = BLACK
+        self.root = root
+
+    def search(self, key):
+        """
+        Return True if 'key' is found in the tree, else False.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while node != NIL:
+            k = keys[node]
+            if k == key:
+                return True
+            node = left[node] if key < k else right[node]
+        return False
+
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' exist in the tree, walking each one in
+        this loop instead of calling search() per query.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        root = self.root
+        count = 0
+        for key in queries:
+            node = root
+            while node != NIL:
+                k = keys[node]
+                if k == key:
+                    count += 1
+                    break
+                node = left[node] if key < k else right[node]
+        return count
+
+    def delete(self, key):
+        """
+        Delete the node with the given 'key' if it exists in the tree.
+
+        Steps:
+        1. BST find the node (z).
+        2. If not found (z == NIL), do nothing.
+        3. Perform standard BST deletion but track the original color.
+        4. If original color was BLACK, call _fix_delete to restore invariants.
+        """
+        keys, left, right, parent, color = self.keys, self.left, self.right, self.parent, self.color
+        z = self.root
+        # 1. BST search to locate node z
+        while z != NIL and keys[z] != key:
+            z = left[z] if key < keys[z] else right[z]
+
+        if z == NIL:
+            # Key not found
+            return
+
+        # y is the node we'll actually remove or move
+        y = z
+        y_original_color = color[y]
+        if left[z] == NIL:
+            x = right[z]
+            self._rb_transplant(z, x)
+        elif right[z] == NIL:
+            x = left[z]
+            self._rb_transplant(z, x)
+        else:
+            # Find successor (minimum of z.right)
+            y = right[z]
+            while left[y] != NIL:
+                y = left[y]
+            y_original_color = color[y]
+            x = right[y]
+            if parent[y] == z:
+                parent[x] = y
+            else:
+                self._rb_transplant(y, x)
+                right[y] = right[z]
+                parent[right[y]] = y
+            self._rb_transplant(z, y)
+            left[y] = left[z]
+            parent[left[y]] = y
+            # Copy color of z into successor to preserve black-height
+            color[y] = color[z]
+
+        self._free.append(z)
+
+        if y_original_color == BLACK:
+            self._fix_delete(x)
+
+    def _rb_transplant(self, u, v):
+        """
+        Replace subtree rooted at u with subtree rooted at v.
+        """
+        parent, left = self.parent, self.left
+        up = parent[u]
+        if up == NIL:
+            self.root = v
+        elif u == left[up]:
+            left[up] = v
+        else:
+            self.right[up] = v
+        parent[v] = up
+
+    def _fix_delete(self, x):
+        """
+        Restore Red-Black invariants after a delete operation
+        potentially removed a BLACK node (or replaced it).
+        d is x's side under its parent (0 = left, 1 = right), so one code path
+        covers both mirror cases.
+        """
+        parent, color = self.parent, self.color
+        child = (self.left, self.right)
+        while x != self.root and color[x] == BLACK:
+            xp = parent[x]
+            d = x != child[0][xp]
+            near, far = child[d], child[1 - d]
+            sib = far[xp]
+            # Case 1: sibling is RED
+            if color[sib] == RED:
+                color[sib] = BLACK
+                color[xp] = RED
+                self._rotate(xp, d)
+                sib = far[xp]
+            # Case 2: sibling is BLACK, both children black
+            if color[near[sib]] == BLACK and color[far[sib]] == BLACK:
+                color[sib] = RED
+                x = xp
+            else:
+                # Case 3: sibling is black, near child is red, far child is black
+                if color[far[sib]] == BLACK:
+                    color[near[sib]] = BLACK
+                    color[sib] = RED
+                    self._rotate(sib, 1 - d)
+                    sib = far[xp]
+                # Case 4: sibling is black, far child is red
+                color[sib] = color[xp]
+                color[xp] = BLACK
+                color[far[sib]] = BLACK
+                self._rotate(xp, d)
+                x = self.root
+        color[x] = BLACK
@@ -0,0 +1,120 @@
+"""
+References:
+1. Python docs: bisect — Array bisection algorithm — https://docs.python.org/3/library/bisect.html
+2. Grant Jenks: sortedcontainers, SortedList implementation notes — https://grantjenks.com/docs/sortedcontainers/implementation.html
+
+Baseline for the tree benchmarks: no tree at all, just sorted arrays and
+binary search.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+class SortedArraySet:
+    """
+    A sorted sequence of keys, supporting insertion, search, and deletion
+    by binary search.
+
+    One flat sorted array would make every insert/delete shift O(n) keys
+    (about 4 MB per update at a million keys), so the keys are cut into
+    sorted blocks of between 1 and 2 * LOAD keys. 'maxes' holds the largest
+    key of each block: an operation bisects 'maxes' to pick a block, then
+    bisects inside that block, and only that block's tail is shifted.
+    Duplicate keys are allowed; delete removes one occurrence.
+
+    Attributes:
+        blocks: List of sorted Python lists holding the keys in order.
+        maxes: maxes[i] is the last (largest) key of blocks[i].
+    """
+    LOAD = 1000  # Block size after a split or bulk load
+
+    def __init__(self):
+        """
+        Initialize an empty set.
+        """
+        self.blocks = []
+        self.maxes = []
+
+    def insert(self, key):
+        """
+        Insert 'key' into the block whose range covers it (the last block for
+        a new maximum), splitting that block in half once it exceeds 2 * LOAD.
+        """
+        maxes = self.maxes
+        if not maxes:
+            self.blocks.append([key])
+            maxes.append(key)
+            return
+        pos = bisect_right(maxes, key)
+        if pos == len(maxes):
+            # New maximum: append to the last block
+            pos -= 1
+            block = self.blocks[pos]
+            block.append(key)
+            maxes[pos] = key
+        else:
+            block = self.blocks[pos]
+            insort(block, key)
+        if len(block) > 2 * self.LOAD:
+            half = block[self.LOAD:]
+            del block[self.LOAD:]
+            maxes[pos] = block[-1]
+            self.blocks.insert(pos + 1, half)
+            maxes.insert(pos + 1, half[-1])
+
+    def bulk_load(self, keys):
+        """
+        Replace the set's contents with 'keys': sort them once and cut the
+        result into blocks of LOAD keys.
+        """
+        keys = sorted(keys)
+        load = self.LOAD
+        self.blocks = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self.maxes = [block[-1] for block in self.blocks]
+
+    def search(self, key):
+        """
+        Return True if 'key' is in the set, else False.
+        """
+        maxes = self.maxes
+        pos = bisect_left(maxes, key)
+        if pos == len(maxes):
+            return False
+        # maxes[pos] >= key, so bisect_left stays inside the block
+        block = self.blocks[pos]
+        return block[bisect_left(block, key)] == key
+
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' are in the set, bisecting for each one
+        in this loop instead of calling search() per query.
+        """
+        blocks, maxes = self.blocks, self.maxes
+        n = len(maxes)
+        count = 0
+        for key in queries:
+            pos = bisect_left(maxes, key)
+            if pos < n:
+                block = blocks[pos]
+                if block[bisect_left(block, key)] == key:
+                    count += 1
+        return count
+
+    def delete(self, key):
+        """
+        Delete one occurrence of 'key' if it exists; a block left empty is
+        dropped along with its 'maxes' entry.
+        """
+        maxes = self.maxes
+        pos = bisect_left(maxes, key)
+        if pos == len(maxes):
+            return
+        block = self.blocks[pos]
+        i = bisect_left(block, key)
+        if block[i] != key:
+            return
+        del block[i]
+        if not block:
+            del self.blocks[pos]
+            del maxes[pos]
+        elif i == len(block):
+            maxes[pos] = block[-1]
@@ -5,6 +5,17 @@ References:
 """
 
 import random
+from array import array
+
+from AVL_Tree import eytzinger_fill, eytzinger_search
+
+try:
+    from _treap_core import (CTreapNode, search as _c_search, search_count as _c_search_count,
+                             insert as _c_insert, delete as _c_delete)
+except ImportError:  # extension not built (python setup.py build_ext --inplace)
+    CTreapNode = None
+
+_random = random.random  # Bound once: one C call per priority, no module/attribute lookup
 
 class TreapNode:
     """
@@ -16,11 +27,13 @@ class TreapNode:
         left: Reference to the left child.
         right: Reference to the right child.
     """
+    __slots__ = ('key', 'priority', 'left', 'right')
+
     def __init__(self, key):
         self.key = key
         # Use either random.random() for a float priority in [0,1]
         # or random.randint for an integer priority.
-        self.priority = random.random()
+        self.priority = _random()
         self.left = None
         self.right = None
 
@@ -32,12 +45,78 @@ class Treap:
     - Insertion, search, and deletion all average O(log n).
       Worst case can degrade to O(n), but this is rare.
     """
+    _Node = TreapNode  # Node class used for new nodes
+    _POOL_MAX = 1 << 16  # Cap on deleted nodes kept for reuse
 
     def __init__(self):
         """
         Initialize an empty Treap.
         """
         self.root = None
+        self._pool = []  # Nodes unlinked by delete, reused by _new_node
+        self._frozen = None  # Eytzinger snapshot built by freeze()
+
+    def _new_node(self, key):
+        """
+        Return a leaf node holding 'key' with a fresh random priority,
+        reusing a pooled node when available.
+        """
+        pool = self._pool
+        if pool:
+            node = pool.pop()
+            node.key = key
+            node.priority = _random()
+            return node
+        return self._Node(key)
+
+    def _release(self, node):
+        """
+        Clear a node that has been unlinked from the treap and return it to the pool.
+        """
+        if len(self._pool) < self._POOL_MAX:
+            node.key = node.left = node.right = None
+            self._pool.append(node)
+
+    def bulk_load(self, keys):
+        """
+        Replace the treap's contents with 'keys', building a perfectly balanced
+        treap after sorting: each subtree root is the median of its key range.
+        Fresh random priorities are drawn as one batch, sorted in decreasing
+        order and handed out in build order, so every parent outranks its
+        children. Nodes are allocated without running __init__, so the batch is
+        the only draw per node.
+        """
+        keys = sorted(keys)
+        n = len(keys)
+        self._frozen = None
+        Node = self._Node
+        new = Node.__new__
+        priorities = [_random() for _ in range(n)]
+        priorities.sort(reverse=True)
+        i = 0
+
+        root = None
+        # Explicit stack of (lo, hi, parent, is_left) key ranges still to build
+        stack = [(0, n, None, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) >> 1
+            node = new(Node)
+            node.key = keys[mid]
+            node.priority = priorities[i]
+            node.left = node.right = None
+            i += 1
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((lo, mid, node, True))
+            stack.append((mid + 1, hi, node, False))
+        self.root = root
 
     def search(self, key):
         """
@@ -48,89 +127,170 @@ class Treap:
         """
         return self._search(self.root, key)
 
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' exist in the Treap, walking each one in
+        this loop instead of calling search() per query.
+        """
+        root = self.root
+        count = 0
+        for key in queries:
+            node = root
+            while node:
+                k = node.key
+                if k == key:
+                    count += 1
+                    break
+                node = node.left if key < k else node.right
+        return count
+
     def _search(self, node, key):
         """
-        Internal recursive search.
+        Internal iterative search.
         If node is None, the key doesn't exist.
         Otherwise, compare and go left/right based on BST property.
         """
-        if not node:
-            return False
-        if node.key == key:
-            return True
-        elif key < node.key:
-            return self._search(node.left, key)
-        else:
-            return self._search(node.right, key)
+        while node:
+            k = node.key
+            if k == key:
+                return True
+            node = node.left if key < k else node.right
+        return False
+
+    def freeze(self):
+        """
+        Snapshot the keys into an Eytzinger-ordered array('q') for read-only
+        lookups (see AVLTree.freeze). Any insert/delete discards the snapshot.
+        """
+        keys = []
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            keys.append(node.key)
+            node = node.right
+        a = array('q', bytes(8 * (len(keys) + 1)))  # slot 0 is unused
+        self._frozen = eytzinger_fill(keys, a)
+        return a
+
+    def search_frozen(self, key):
+        """
+        Return True if 'key' exists, using the Eytzinger snapshot (built on demand).
+        """
+        a = self._frozen
+        if a is None:
+            a = self.freeze()
+        return eytzinger_search(a, key)
 
     def insert(self, key):
         """
         Insert a new 'key' into the Treap.
 
         Steps:
-        1. Insert as in a normal BST (recursive).
+        1. Insert as in a normal BST (iterative, recording the path).
         2. If child's priority is higher than parent's, rotate to fix violation.
         """
+        self._frozen = None
         self.root = self._insert(self.root, key)
 
     def _insert(self, node, key):
         """
-        Internal recursive insertion:
-        - Insert by BST rules.
-        - If newly inserted node's priority > current node's priority, rotate.
+        Internal iterative insertion:
+        - Insert by BST rules, recording the ancestors on a stack.
+        - Walk back up: while the new node's priority > its parent's priority,
+          rotate it above the parent (rotations are inlined). The side taken
+          at each ancestor is recomputed from the key rather than stored.
+        Returns the new subtree root.
         """
-        if not node:
-            return TreapNode(key)
+        root = node
+        stack = []
+        while node:
+            stack.append(node)
+            node = node.left if key < node.key else node.right
+        node = self._new_node(key)
+        priority = node.priority
 
-        if key < node.key:
-            node.left = self._insert(node.left, key)
-            # If heap property is violated (child has higher priority)
-            if node.left.priority > node.priority:
-                node = self._right_rotate(node)
-        else:
-            node.right = self._insert(node.right, key)
-            if node.right.priority > node.priority:
-                node = self._left_rotate(node)
+        while stack:
+            parent = stack.pop()
+            if key < parent.key:
+                if priority <= parent.priority:
+                    parent.left = node
+                    # Heap property holds here, so it holds for every ancestor above
+                    return root
+                # Right-rotate the new node above its parent
+                parent.left = node.right
+                node.right = parent
+            else:
+                if priority <= parent.priority:
+                    parent.right = node
+                    return root
+                # Left-rotate the new node above its parent
+                parent.right = node.left
+                node.left = parent
         return node
 
     def delete(self, key):
         """
         Delete 'key' from the Treap if it exists.
         """
+        self._frozen = None
         self.root = self._delete(self.root, key)
 
     def _delete(self, node, key):
         """
-        Internal recursive deletion:
-        - If key < node.key, recurse left.
-        - If key > node.key, recurse right.
-        - If key == node.key, remove this node:
-            * If node has one child, return that child.
-            * If node has two children, rotate based on priority to move the node down,
-              then remove it when it has at most one child.
+        Internal iterative deletion:
+        - Walk down by BST rules to the node holding 'key'. Only its parent is
+          ever relinked, so no path stack is needed.
+        - While that node has two children, rotate the higher-priority child
+          above it, moving the node one level down.
+        - Once it has at most one child, replace it with that child.
+        Returns the new subtree root.
         """
+        root = node
+        # 'parent' is the node above 'node' (None at the root) and went_left
+        # says which of its children 'node' is
+        parent, went_left = None, False
+        while node:
+            k = node.key
+            if k == key:
+                break
+            parent = node
+            went_left = key < k
+            node = node.left if went_left else node.right
+
         if not node:
-            return None
+            return root
 
-        if key < node.key:
-            node.left = self._delete(node.left, key)
-        elif key > node.key:
-            node.right = self._delete(node.right, key)
-        else:
-            # Found the node to delete
-            if not node.left:
-                return node.right
-            elif not node.right:
-                return node.left
+        left, right = node.left, node.right
+        while left and right:
+            # Rotate based on priority
+            if left.priority > right.priority:
+                top = self._right_rotate(node)
+                node_went_left = False
             else:
-                # Rotate based on priority
-                if node.left.priority > node.right.priority:
-                    node = self._right_rotate(node)
-                    node.right = self._delete(node.right, key)
-                else:
-                    node = self._left_rotate(node)
-                    node.left = self._delete(node.left, key)
-        return node
+                top = self._left_rotate(node)
+                node_went_left = True
+            if parent is None:
+                root = top
+            elif went_left:
+                parent.left = top
+            else:
+                parent.right = top
+            parent, went_left = top, node_went_left
+            left, right = node.left, node.right
+
+        child = left if left else right
+        self._release(node)
+        if parent is None:
+            return child
+        if went_left:
+            parent.left = child
+        else:
+            parent.right = child
+        return root
 
     def _left_rotate(self, x):
         """
@@ -149,3 +309,40 @@ class Treap:
         x.left = y.right
         y.right = x
         return y
+
+
+class CTreap(Treap):
+    """
+    Treap over int64 keys built from the Cython CTreapNode, with insert, search
+    and delete running in the compiled _treap_core extension. bulk_load and
+    freeze are inherited.
+    """
+    _Node = CTreapNode
+
+    def __init__(self):
+        if CTreapNode is None:
+            raise ImportError("_treap_core is not built; run: python setup.py build_ext --inplace")
+        super().__init__()
+
+    def insert(self, key):
+        """
+        Insert a new 'key' into the Treap (compiled).
+        """
+        self._frozen = None
+        self.root = _c_insert(self.root, key)
+
+    def delete(self, key):
+        """
+        Delete 'key' from the Treap if it exists (compiled).
+        """
+        self._frozen = None
+        self.root = _c_delete(self.root, key)
+
+    def _search(self, node, key):
+        return _c_search(node, key)
+
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' exist in the Treap (compiled).
+        """
+        return _c_search_count(self.root, queries)
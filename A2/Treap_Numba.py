@@ -0,0 +1,341 @@
+"""
+References:
+1. Wikipedia: Treap — https://en.wikipedia.org/wiki/Treap
+2. Numba documentation — https://numba.readthedocs.io/
+
+Numba-compiled variant of Treap.py for int64 keys.
+The treap lives in preallocated NumPy arrays (keys, left, right, pri) and
+every node is an integer index; index 0 is the NIL node, whose priority is
+below every real one. Instead of rotating the new node up (or the deleted
+node down), insert splits and delete merges subtrees top-down, which gives
+the same treap without a path stack, so no depth limit is needed.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+NIL = 0         # Index of the NIL node
+MAX_DEPTH = 64  # Stack size for bulk_load; a median-built tree of depth 64 needs > 10^19 nodes
+
+@njit(cache=True)
+def treap_insert(keys, left, right, pri, root, key, new_id):
+    """
+    Insert 'key' into the treap rooted at 'root', storing it in the free slot
+    'new_id' (whose priority pri[new_id] is already set). Returns the new root.
+    """
+    p = pri[new_id]
+
+    # Descend until the new node outranks the current node
+    parent = NIL
+    went_left = False
+    node = root
+    while node != NIL and pri[node] >= p:
+        parent = node
+        went_left = key < keys[node]
+        node = left[node] if went_left else right[node]
+
+    keys[new_id] = key
+    left[new_id] = NIL
+    right[new_id] = NIL
+    if parent == NIL:
+        root = new_id
+    elif went_left:
+        left[parent] = new_id
+    else:
+        right[parent] = new_id
+
+    # Split the displaced subtree into keys <= key (new node's left subtree)
+    # and keys > key (its right subtree). l_hole / r_hole is the node whose
+    # right / left link is the next one to fill (new_id for the first link).
+    l_hole = new_id
+    r_hole = new_id
+    while node != NIL:
+        if keys[node] <= key:
+            if l_hole == new_id:
+                left[new_id] = node
+            else:
+                right[l_hole] = node
+            l_hole = node
+            node = right[node]
+        else:
+            if r_hole == new_id:
+                right[new_id] = node
+            else:
+                left[r_hole] = node
+            r_hole = node
+            node = left[node]
+    if l_hole != new_id:
+        right[l_hole] = NIL
+    if r_hole != new_id:
+        left[r_hole] = NIL
+    return root
+
+@njit(cache=True)
+def treap_search(keys, left, right, root, key):
+    """
+    Return True if 'key' exists in the treap rooted at 'root'.
+    """
+    node = root
+    while node != NIL:
+        k = keys[node]
+        if k == key:
+            return True
+        node = left[node] if key < k else right[node]
+    return False
+
+@njit(parallel=True, cache=True)
+def treap_search_batch(keys, left, right, root, queries):
+    """
+    Search every key in 'queries' (in parallel across cores) and return a
+    boolean mask of which ones exist.
+    """
+    out = np.empty(queries.shape[0], dtype=np.bool_)
+    for i in prange(queries.shape[0]):
+        out[i] = treap_search(keys, left, right, root, queries[i])
+    return out
+
+@njit(cache=True)
+def treap_insert_batch(keys, left, right, pri, root, batch, ids):
+    """
+    Insert every key of 'batch' in order, batch[i] going into the free slot
+    ids[i], in one compiled loop. Returns the new root.
+    """
+    for i in range(batch.shape[0]):
+        root = treap_insert(keys, left, right, pri, root, batch[i], ids[i])
+    return root
+
+@njit(cache=True)
+def treap_delete_batch(keys, left, right, pri, root, batch):
+    """
+    Delete one occurrence of every key of 'batch' in order, in one compiled
+    loop. Returns (new_root, removed), where removed[i] is the slot freed by
+    batch[i] (NIL if it was absent).
+    """
+    removed = np.empty(batch.shape[0], dtype=np.int64)
+    for i in range(batch.shape[0]):
+        root, removed[i] = treap_delete(keys, left, right, pri, root, batch[i])
+    return root, removed
+
+@njit(cache=True)
+def treap_delete(keys, left, right, pri, root, key):
+    """
+    Delete one occurrence of 'key' from the treap rooted at 'root'.
+    Returns (new_root, removed_id), where removed_id is NIL if 'key' was absent.
+    """
+    parent = NIL
+    went_left = False
+    node = root
+    while node != NIL:
+        k = keys[node]
+        if k == key:
+            break
+        parent = node
+        went_left = key < k
+        node = left[node] if went_left else right[node]
+
+    if node == NIL:
+        return root, NIL
+
+    # Merge the two subtrees into the removed node's place: the higher-priority
+    # root goes first, and the merge continues down its inner side
+    a = left[node]
+    b = right[node]
+    while True:
+        if a == NIL or b == NIL:
+            top = a if a != NIL else b
+        elif pri[a] > pri[b]:
+            top = a
+        else:
+            top = b
+        if parent == NIL:
+            root = top
+        elif went_left:
+            left[parent] = top
+        else:
+            right[parent] = top
+        if a == NIL or b == NIL:
+            break
+        parent = top
+        if top == a:
+            went_left = False
+            a = right[a]
+        else:
+            went_left = True
+            b = left[b]
+    return root, node
+
+@njit(cache=True)
+def treap_bulk_load(sorted_keys, keys, left, right):
+    """
+    Build a perfectly balanced treap over 'sorted_keys' into the node arrays.
+    Node ids 1..n are handed out in build order (every parent before its
+    children), so priorities that decrease with the id keep the heap property.
+    Returns the root.
+    """
+    n = sorted_keys.shape[0]
+    # Explicit stack of (lo, hi, parent, is_left) key ranges still to build;
+    # each pop pushes two ranges one level deeper, so 2 * MAX_DEPTH slots suffice
+    lo_stack = np.empty(2 * MAX_DEPTH, dtype=np.int64)
+    hi_stack = np.empty(2 * MAX_DEPTH, dtype=np.int64)
+    parent_stack = np.empty(2 * MAX_DEPTH, dtype=np.int64)
+    left_stack = np.empty(2 * MAX_DEPTH, dtype=np.bool_)
+    lo_stack[0] = 0
+    hi_stack[0] = n
+    parent_stack[0] = NIL
+    left_stack[0] = False
+    top = 1
+    root = NIL
+    node = NIL
+    while top > 0:
+        top -= 1
+        lo = lo_stack[top]
+        hi = hi_stack[top]
+        parent = parent_stack[top]
+        is_left = left_stack[top]
+        if lo >= hi:
+            continue
+        mid = (lo + hi) >> 1
+        node += 1
+        keys[node] = sorted_keys[mid]
+        left[node] = NIL
+        right[node] = NIL
+        if parent == NIL:
+            root = node
+        elif is_left:
+            left[parent] = node
+        else:
+            right[parent] = node
+        lo_stack[top] = lo
+        hi_stack[top] = mid
+        parent_stack[top] = node
+        left_stack[top] = True
+        lo_stack[top + 1] = mid + 1
+        hi_stack[top + 1] = hi
+        parent_stack[top + 1] = node
+        left_stack[top + 1] = False
+        top += 2
+    return root
+
+class NumbaTreap:
+    """
+    A Treap of int64 keys whose insert/search/delete run as Numba-compiled code.
+    """
+    def __init__(self, capacity=1024):
+        """
+        Preallocate room for 'capacity' nodes (plus the NIL node at index 0),
+        with a random priority drawn up front for every slot.
+        """
+        capacity += 1
+        self.keys = np.zeros(capacity, dtype=np.int64)
+        self.left = np.zeros(capacity, dtype=np.int64)
+        self.right = np.zeros(capacity, dtype=np.int64)
+        self.pri = np.random.random_sample(capacity)
+        self.pri[NIL] = -1.0  # Below every real priority in [0, 1)
+        self.size = 1  # Next never-used slot; slot 0 is NIL
+        self._free = []
+        self.root = NIL
+
+    def _grow(self):
+        """
+        Double the capacity of every node array, drawing priorities for the new slots.
+        """
+        n = len(self.keys)
+        for name in ('keys', 'left', 'right'):
+            arr = getattr(self, name)
+            grown = np.zeros(2 * n, dtype=np.int64)
+            grown[:n] = arr
+            setattr(self, name, grown)
+        self.pri = np.concatenate((self.pri, np.random.random_sample(n)))
+
+    def _alloc(self):
+        if self._free:
+            return self._free.pop()
+        if self.size == len(self.keys):
+            self._grow()
+        self.size += 1
+        return self.size - 1
+
+    def _alloc_batch(self, n):
+        """
+        Return an int64 array of 'n' slot ids: released slots first, then
+        never-used ones (growing the arrays as needed).
+        """
+        free = self._free
+        reused = min(n, len(free))
+        ids = np.empty(n, dtype=np.int64)
+        ids[:reused] = free[len(free) - reused:]
+        del free[len(free) - reused:]
+        fresh = n - reused
+        while self.size + fresh > len(self.keys):
+            self._grow()
+        ids[reused:] = np.arange(self.size, self.size + fresh)
+        self.size += fresh
+        return ids
+
+    def bulk_load(self, keys):
+        """
+        Replace the treap's contents with 'keys', building a perfectly balanced
+        treap with a single compiled pass after sorting. The slots' priorities
+        are reordered to decrease with the node id, which the build relies on.
+        """
+        sorted_keys = np.sort(np.asarray(keys, dtype=np.int64))
+        n = len(sorted_keys)
+        while len(self.keys) < n + 1:
+            self._grow()
+        self.pri[1:n + 1] = np.sort(self.pri[1:n + 1])[::-1]
+        self.size = n + 1
+        self._free = []
+        self.root = treap_bulk_load(sorted_keys, self.keys, self.left, self.right)
+
+    def insert(self, key):
+        """
+        Insert a new 'key' into the Treap.
+        """
+        new_id = self._alloc()
+        self.root = treap_insert(self.keys, self.left, self.right, self.pri, self.root, key, new_id)
+
+    def search(self, key):
+        """
+        Check if 'key' exists in the Treap.
+        """
+        return treap_search(self.keys, self.left, self.right, self.root, key)
+
+    def search_batch(self, queries):
+        """
+        Return a boolean NumPy mask of which 'queries' exist, answering them
+        all in one compiled call instead of one Python call per key.
+        """
+        queries = np.asarray(queries, dtype=np.int64)
+        return treap_search_batch(self.keys, self.left, self.right, self.root, queries)
+
+    def search_count(self, queries):
+        """
+        Return how many of 'queries' exist (see search_batch).
+        """
+        return int(self.search_batch(queries).sum())
+
+    def delete(self, key):
+        """
+        Delete 'key' from the Treap if it exists.
+        """
+        self.root, removed = treap_delete(self.keys, self.left, self.right, self.pri, self.root, key)
+        if removed != NIL:
+            self._free.append(removed)
+
+    def insert_batch(self, keys):
+        """
+        Insert every key of 'keys' in order with one compiled call, the same
+        as calling insert() on each but without a Python call per key.
+        """
+        batch = np.asarray(keys, dtype=np.int64)
+        ids = self._alloc_batch(len(batch))
+        self.root = treap_insert_batch(self.keys, self.left, self.right, self.pri, self.root, batch, ids)
+
+    def delete_batch(self, keys):
+        """
+        Delete one occurrence of every key of 'keys' in order with one
+        compiled call, the same as calling delete() on each.
+        """
+        batch = np.asarray(keys, dtype=np.int64)
+        self.root, removed = treap_delete_batch(self.keys, self.left, self.right, self.pri, self.root, batch)
+        self._free.extend(removed[removed != NIL].tolist())
@@ -0,0 +1,229 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled core for Red_Black_Tree.CRBTree.
+
+CRBNode mirrors RBNode with C-typed fields, so the routines below follow
+left/right as direct struct-field loads and compare keys as C integers,
+with no Python frame or attribute lookup per level. insert() and delete()
+are the same parent-pointer-free algorithms as RBTree: the root-to-node path
+is recorded in a C array of borrowed node pointers (every node on it stays
+linked into the tree for the whole call) and the fix-ups walk back up it.
+
+Build in place with:
+    python setup.py build_ext --inplace
+"""
+
+from cpython.ref cimport PyObject
+
+cdef enum:
+    MAX_DEPTH = 128  # Path array size; a red-black tree that deep needs > 2^63 nodes
+
+cdef class CRBNode:
+    """
+    A Red-Black Tree node with an int64 key (see Red_Black_Tree.RBNode).
+    """
+    cdef public long long key
+    cdef public bint color
+    cdef public CRBNode left, right
+
+    def __init__(self, long long key=0, bint color=True, CRBNode left=None, CRBNode right=None):
+        self.key = key
+        self.color = color
+        self.left = left
+        self.right = right
+
+cpdef bint search(CRBNode root, long long key):
+    """
+    Return True if 'key' is found in the tree rooted at 'root' (None if empty).
+    """
+    cdef CRBNode node = root
+    while node is not None:
+        if node.key == key:
+            return True
+        node = node.left if key < node.key else node.right
+    return False
+
+cpdef Py_ssize_t search_count(CRBNode root, queries):
+    """
+    Return how many of 'queries' are found in the tree rooted at 'root', with
+    the whole loop compiled (one call instead of one search() per query).
+    """
+    cdef Py_ssize_t count = 0
+    cdef long long key
+    cdef CRBNode node
+    for q in queries:
+        key = q
+        node = root
+        while node is not None:
+            if node.key == key:
+                count += 1
+                break
+            node = node.left if key < node.key else node.right
+    return count
+
+cdef inline CRBNode _rotate(CRBNode x, CRBNode parent, bint d):
+    """
+    Rotate around x, moving it down to side d (0 = left rotation, 1 = right)
+    and relinking 'parent' (None for the root). Returns the new subtree root.
+    """
+    cdef CRBNode y
+    if d:
+        y = x.left
+        x.left = y.right
+        y.right = x
+    else:
+        y = x.right
+        x.right = y.left
+        y.left = x
+    if parent is not None:
+        if parent.left is x:
+            parent.left = y
+        else:
+            parent.right = y
+    return y
+
+cpdef CRBNode insert(CRBNode root, long long key):
+    """
+    Insert 'key' into the tree rooted at 'root' and return the new root.
+    """
+    cdef PyObject* path[MAX_DEPTH]
+    cdef int depth = 0
+    cdef CRBNode node = root, p, gp, ggp, uncle, top
+    cdef bint went_left = False, d
+
+    while node is not None:
+        path[depth] = <PyObject*>node
+        depth += 1
+        went_left = key < node.key
+        node = node.left if went_left else node.right
+
+    node = CRBNode.__new__(CRBNode)
+    node.key = key
+    if depth == 0:
+        return node  # color is BLACK (False) by default
+    node.color = True
+    p = <CRBNode>path[depth - 1]
+    if went_left:
+        p.left = node
+    else:
+        p.right = node
+
+    while depth > 0:
+        p = <CRBNode>path[depth - 1]
+        if not p.color:
+            break
+        # A red parent is never the root, so the grandparent exists
+        gp = <CRBNode>path[depth - 2]
+        depth -= 2
+        d = p is gp.right
+        uncle = gp.left if d else gp.right
+        if uncle is not None and uncle.color:
+            # Case 1: recolor and continue from the grandparent
+            p.color = False
+            uncle.color = False
+            gp.color = True
+            node = gp
+            continue
+        ggp = <CRBNode>path[depth - 1] if depth > 0 else None
+        if node is not (p.right if d else p.left):
+            # Case 2: inside child, rotate the parent toward its side
+            p = _rotate(p, gp, d)
+        # Case 3: outside child, rotate the grandparent and recolor
+        p.color = False
+        gp.color = True
+        top = _rotate(gp, ggp, not d)
+        if ggp is None:
+            root = top
+        break
+    root.color = False
+    return root
+
+cpdef CRBNode delete(CRBNode root, long long key):
+    """
+    Delete one occurrence of 'key' from the tree rooted at 'root' (if present)
+    and return the new root.
+    """
+    cdef PyObject* path[MAX_DEPTH + 1]  # case 1 can push one extra ancestor
+    cdef int depth = 0
+    cdef CRBNode node = root, z, y, x, xp, sib, near, far, top, gpar
+    cdef bint d
+
+    while node is not None:
+        if node.key == key:
+            break
+        path[depth] = <PyObject*>node
+        depth += 1
+        node = node.left if key < node.key else node.right
+    if node is None:
+        return root
+
+    z = node
+    if z.left is not None and z.right is not None:
+        # Copy the successor's key into z and remove the successor instead
+        path[depth] = <PyObject*>z
+        depth += 1
+        y = z.right
+        while y.left is not None:
+            path[depth] = <PyObject*>y
+            depth += 1
+            y = y.left
+        z.key = y.key
+        z = y
+
+    # z has at most one child, x, which takes its place
+    x = z.right if z.left is None else z.left
+    if depth == 0:
+        root = x
+    else:
+        xp = <CRBNode>path[depth - 1]
+        if xp.left is z:
+            xp.left = x
+        else:
+            xp.right = x
+    if z.color:
+        return root
+
+    while depth > 0 and (x is None or not x.color):
+        xp = <CRBNode>path[depth - 1]
+        # The removed node was BLACK, so x's sibling is never None
+        d = x is xp.right
+        sib = xp.left if d else xp.right
+        gpar = <CRBNode>path[depth - 2] if depth > 1 else None
+        if sib.color:
+            # Case 1: red sibling -> rotate it above the parent
+            sib.color = False
+            xp.color = True
+            top = _rotate(xp, gpar, d)
+            if gpar is None:
+                root = top
+            path[depth - 1] = <PyObject*>sib
+            path[depth] = <PyObject*>xp
+            depth += 1
+            gpar = sib
+            sib = xp.left if d else xp.right
+        near = sib.right if d else sib.left
+        far = sib.left if d else sib.right
+        if (far is None or not far.color) and (near is None or not near.color):
+            # Case 2: recolor and move up
+            sib.color = True
+            x = xp
+            depth -= 1
+            continue
+        if far is None or not far.color:
+            # Case 3: near nephew red -> rotate the sibling away from x
+            sib.color = True
+            near.color = False
+            sib = _rotate(sib, xp, not d)
+            far = sib.left if d else sib.right
+        # Case 4: far nephew red -> rotate the parent toward x and recolor
+        sib.color = xp.color
+        xp.color = False
+        far.color = False
+        top = _rotate(xp, gpar, d)
+        if gpar is None:
+            root = top
+        x = None
+        break
+    if x is not None:
+        x.color = False
+    return root
@@ -0,0 +1,151 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled core for Treap.CTreap.
+
+CTreapNode mirrors TreapNode with C-typed fields (int64 key, double
+priority), and insert()/search()/delete() are the same iterative algorithms
+as Treap, so every level is a struct-field load and a C compare. insert()
+records its path in a C array of borrowed node pointers; every node on it
+stays linked into the treap for the whole call.
+
+Build in place with:
+    python setup.py build_ext --inplace
+"""
+
+from cpython.ref cimport PyObject
+from random import random as _random
+
+cdef enum:
+    MAX_DEPTH = 4096  # Path array size; a treap's expected depth is ~3 ln n
+
+cdef class CTreapNode:
+    """
+    A Treap node with an int64 key and a random priority (see Treap.TreapNode).
+    """
+    cdef public long long key
+    cdef public double priority
+    cdef public CTreapNode left, right
+
+    def __init__(self, long long key=0):
+        self.key = key
+        self.priority = _random()
+        self.left = None
+        self.right = None
+
+cpdef bint search(CTreapNode root, long long key):
+    """
+    Return True if 'key' is found in the treap rooted at 'root' (None if empty).
+    """
+    cdef CTreapNode node = root
+    while node is not None:
+        if node.key == key:
+            return True
+        node = node.left if key < node.key else node.right
+    return False
+
+cpdef Py_ssize_t search_count(CTreapNode root, queries):
+    """
+    Return how many of 'queries' are found in the treap rooted at 'root', with
+    the whole loop compiled (one call instead of one search() per query).
+    """
+    cdef Py_ssize_t count = 0
+    cdef long long key
+    cdef CTreapNode node
+    for q in queries:
+        key = q
+        node = root
+        while node is not None:
+            if node.key == key:
+                count += 1
+                break
+            node = node.left if key < node.key else node.right
+    return count
+
+cpdef CTreapNode insert(CTreapNode root, long long key):
+    """
+    Insert 'key' into the treap rooted at 'root' and return the new root.
+    """
+    cdef PyObject* path[MAX_DEPTH]
+    cdef bint went[MAX_DEPTH]
+    cdef int depth = 0
+    cdef CTreapNode node = root, parent
+
+    while node is not None:
+        if depth == MAX_DEPTH:
+            raise RecursionError("treap is deeper than MAX_DEPTH")
+        path[depth] = <PyObject*>node
+        went[depth] = key < node.key
+        node = node.left if went[depth] else node.right
+        depth += 1
+
+    node = CTreapNode.__new__(CTreapNode)
+    node.key = key
+    node.priority = _random()
+
+    while depth > 0:
+        depth -= 1
+        parent = <CTreapNode>path[depth]
+        if went[depth]:
+            parent.left = node
+            if node.priority <= parent.priority:
+                return root
+            # Right-rotate the new node above its parent
+            parent.left = node.right
+            node.right = parent
+        else:
+            parent.right = node
+            if node.priority <= parent.priority:
+                return root
+            # Left-rotate the new node above its parent
+            parent.right = node.left
+            node.left = parent
+    return node
+
+cpdef CTreapNode delete(CTreapNode root, long long key):
+    """
+    Delete one occurrence of 'key' from the treap rooted at 'root' (if present)
+    and return the new root.
+    """
+    cdef CTreapNode node = root, parent = None, left, right, top, child
+    cdef bint went_left = False, node_went_left
+
+    while node is not None:
+        if node.key == key:
+            break
+        parent = node
+        went_left = key < node.key
+        node = node.left if went_left else node.right
+    if node is None:
+        return root
+
+    left, right = node.left, node.right
+    while left is not None and right is not None:
+        # Rotate the higher-priority child above the node
+        if left.priority > right.priority:
+            top = left
+            node.left = top.right
+            top.right = node
+            node_went_left = False
+        else:
+            top = right
+            node.right = top.left
+            top.left = node
+            node_went_left = True
+        if parent is None:
+            root = top
+        elif went_left:
+            parent.left = top
+        else:
+            parent.right = top
+        parent, went_left = top, node_went_left
+        left, right = node.left, node.right
+
+    child = left if left is not None else right
+    node.left = node.right = None
+    if parent is None:
+        return child
+    if went_left:
+        parent.left = child
+    else:
+        parent.right = child
+    return root
@@ -1,8 +1,10 @@
 """
-Compare insertion, search, and deletion times for three data structures:
+Compare insertion, search, and deletion times for four data structures:
  - AVL Tree
  - Red-Black Tree
  - Treap
+ - B-Tree
+plus a sorted-array baseline (SortedArraySet) that uses no tree at all.
 
 Time Complexity Overview:
 -------------------------
@@ -24,30 +26,76 @@ Time Complexity Overview:
    - Deletion:  Average O(log n), Worst O(n)
    - Space:     O(n)
 
+4. B-Tree (minimum degree t)
+   - Insertion: O(t log_t n)
+   - Search:    O(log n), in O(log_t n) node visits
+   - Deletion:  O(t log_t n)
+   - Space:     O(n)
+
+5. SortedArraySet (sorted blocks of at most 2 * LOAD keys)
+   - Insertion: O(log n + LOAD)
+   - Search:    O(log n)
+   - Deletion:  O(log n + LOAD)
+   - Space:     O(n)
+
 References:
 -----------
 - Wikipedia: 
   - https://en.wikipedia.org/wiki/AVL_tree
   - https://en.wikipedia.org/wiki/Red–black_tree
   - https://en.wikipedia.org/wiki/Treap
+  - https://en.wikipedia.org/wiki/B-tree
 - GeeksforGeeks articles on BST balancing.
 """
 
 import time
-import random
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # Files only: skip GUI backend probing
 import matplotlib.pyplot as plt
 
 from AVL_Tree import AVLTree
-from Red_Black_Tree import RBTree
-from Treap import Treap
+from Red_Black_Tree import RBTree, CRBTree, CRBNode
+from Treap import Treap, CTreap, CTreapNode
+from B_Tree import BTree
+from Sorted_Array import SortedArraySet
+
+try:
+    from AVL_Tree_Numba import NumbaAVLTree
+    from Treap_Numba import NumbaTreap
+except ImportError:  # numba not installed
+    NumbaAVLTree = NumbaTreap = None
+
+# Trees to benchmark, by the name used in printouts and plot legends
+TREES = {
+    "AVL": AVLTree,
+    "RB": RBTree,
+    "Treap": Treap,
+    "B-Tree": BTree,
+    "Sorted": SortedArraySet,  # Baseline: binary search over sorted arrays
+}
+
+# Cython-compiled variants, when their extensions are built (python setup.py build_ext --inplace)
+if CRBNode is not None:
+    TREES["RB-C"] = CRBTree
+if CTreapNode is not None:
+    TREES["Treap-C"] = CTreap
+
+# Numba-compiled variants, when numba is installed
+if NumbaAVLTree is not None:
+    TREES["AVL-Nb"] = NumbaAVLTree
+    TREES["Treap-Nb"] = NumbaTreap
 
 def generate_random_data(n=100000, seed=42):
     """
-    Generates 'n' random integers in [0, 10^9], using 'seed' for reproducibility.
+    Generates 'n' random integers in [0, 10^9] as an int64 NumPy array,
+    using 'seed' for reproducibility.
     """
-    random.seed(seed)
-    return [random.randint(0, 10**9) for _ in range(n)]
+    return np.random.default_rng(seed).integers(0, 10**9, size=n, dtype=np.int64, endpoint=True)
 
 def export_dataset(n=100000, seed=42, filename="my_dataset.txt"):
     """
@@ -55,31 +103,60 @@ def export_dataset(n=100000, seed=42, filename="my_dataset.txt"):
     one value per line.
     """
     data = generate_random_data(n, seed)
-    with open(filename, "w") as f:
-        for val in data:
-            f.write(str(val) + "\n")
+    np.savetxt(filename, data, fmt="%d")
     print(f"Dataset of size {n} exported to '{filename}'.")
 
 def benchmark_insertion(tree_class, data):
     """
-    Creates a new 'tree_class' instance and inserts all items in 'data'.
+    Creates a new 'tree_class' instance and loads all items in 'data', using the
+    class's bulk_load() (sort + balanced build) when it has one.
     Returns the total time in seconds.
     """
     tree = tree_class()
+    if not hasattr(tree, "bulk_load"):
+        return benchmark_incremental_insert(tree_class, data)[0]
     start = time.perf_counter()
-    for val in data:
-        tree.insert(val)
+    tree.bulk_load(data)
     end = time.perf_counter()
     return end - start
 
-def benchmark_search(tree_class, data, queries):
+def benchmark_incremental_insert(tree_class, data):
     """
-    Creates a new 'tree_class' instance, inserts 'data', then searches for each item in 'queries'.
-    Returns (elapsed_time, found_count).
+    Creates a new 'tree_class' instance and inserts all items in 'data' one by
+    one, with a single insert_batch() call when the class has one.
+    Returns (elapsed_time, tree), so the built tree can be reused by the
+    search and deletion benchmarks instead of being rebuilt.
     """
     tree = tree_class()
+    if hasattr(tree, "insert_batch"):
+        batch = np.asarray(data, dtype=np.int64)
+        start = time.perf_counter()
+        tree.insert_batch(batch)
+        end = time.perf_counter()
+        return (end - start, tree)
+    start = time.perf_counter()
     for val in data:
         tree.insert(val)
+    end = time.perf_counter()
+    return (end - start, tree)
+
+def benchmark_search(tree, queries):
+    """
+    Searches the already built 'tree' for each item in 'queries', with a
+    single search_batch() or search_count() call when the tree has one.
+    Returns (elapsed_time, found_count).
+    """
+    if hasattr(tree, "search_batch"):
+        batch = np.asarray(queries, dtype=np.int64)
+        start = time.perf_counter()
+        found_count = int(tree.search_batch(batch).sum())
+        end = time.perf_counter()
+        return (end - start, found_count)
+    if hasattr(tree, "search_count"):
+        start = time.perf_counter()
+        found_count = tree.search_count(queries)
+        end = time.perf_counter()
+        return (end - start, found_count)
     start = time.perf_counter()
     found_count = 0
     for q in queries:
@@ -88,25 +165,129 @@ def benchmark_search(tree_class, data, queries):
     end = time.perf_counter()
     return (end - start, found_count)
 
-def benchmark_deletion(tree_class, data, del_keys):
+def benchmark_frozen_search(tree, queries):
+    """
+    Like benchmark_search, but calls tree.freeze() before the query loop
+    and answers the queries with search_frozen().
+    Returns (elapsed_time, found_count).
+    """
+    tree.freeze()
+    start = time.perf_counter()
+    found_count = 0
+    for q in queries:
+        if tree.search_frozen(q):
+            found_count += 1
+    end = time.perf_counter()
+    return (end - start, found_count)
+
+def benchmark_deletion(tree, del_keys):
     """
-    Creates a new 'tree_class' instance, inserts 'data', then deletes each item in 'del_keys'.
+    Deletes each item in 'del_keys' from the already built 'tree' (destructive),
+    with a single delete_batch() call when the tree has one.
     Returns the total time in seconds to perform all deletions.
     """
-    tree = tree_class()
-    for val in data:
-        tree.insert(val)
+    if hasattr(tree, "delete_batch"):
+        batch = np.asarray(del_keys, dtype=np.int64)
+        start = time.perf_counter()
+        tree.delete_batch(batch)
+        end = time.perf_counter()
+        return end - start
     start = time.perf_counter()
     for d in del_keys:
         tree.delete(d)
     end = time.perf_counter()
     return end - start
 
+def warm_up(tree_classes):
+    """
+    Runs every operation of each class once on a few keys, so JIT-compiled
+    trees (Numba) are compiled before any timed section.
+    """
+    keys = list(range(64))
+    for cls in tree_classes:
+        tree = benchmark_incremental_insert(cls, keys)[1]
+        benchmark_search(tree, keys)
+        benchmark_deletion(tree, keys)
+        if hasattr(tree, "bulk_load"):
+            tree.bulk_load(keys)
+
+def mix_queries(rng, data, k_existing, k_new, seed):
+    """
+    Returns an int64 array of 'k_existing' distinct keys drawn from 'data' and
+    'k_new' fresh random keys (generated with 'seed'), shuffled in place with 'rng'.
+    Both parts are written straight into one preallocated buffer.
+    """
+    keys = np.empty(k_existing + k_new, dtype=np.int64)
+    keys[:k_existing] = rng.choice(data, size=k_existing, replace=False)
+    keys[k_existing:] = generate_random_data(n=k_new, seed=seed)
+    rng.shuffle(keys)
+    return keys
+
+@lru_cache(maxsize=1)
+def make_workload(s):
+    """
+    Returns (data, queries, del_keys) for data size 's' as lists of Python ints:
+    's' random keys to insert, plus 20000 (at most 's') search queries and
+    deletion keys, half of them present in 'data' and all in random order.
+    Deterministic, so every worker process rebuilds the same workload; the
+    last one is cached, since consecutive runs share a size.
+    """
+    data = generate_random_data(n=s, seed=123)
+    rng = np.random.default_rng(s)
+
+    # Prepare queries (search)
+    query_count = min(20000, s)
+    queries = mix_queries(rng, data, query_count // 2, query_count // 2, seed=999)
+
+    # Prepare keys (deletion)
+    delete_count = min(20000, s)
+    del_keys = mix_queries(rng, data, delete_count // 2, delete_count // 2, seed=1234)
+
+    # The trees compare Python ints, so convert once, before any timing
+    return data.tolist(), queries.tolist(), del_keys.tolist()
+
+def run_tree(name, s):
+    """
+    Runs every benchmark for TREES[name] on the workload of size 's'. The tree
+    is built once with the timed insert loop and reused for the searches,
+    then for deletion last since that one is destructive; the bulk load
+    builds a fresh tree. Takes the tree by name so it can run in a worker process.
+    Returns a dict of "insert", "bulk", "search", "frozen" and "delete" results
+    ("bulk" and "frozen" are None when the class lacks bulk_load/freeze).
+    """
+    cls = TREES[name]
+    data, queries, del_keys = make_workload(s)
+    result = {}
+    result["insert"], tree = benchmark_incremental_insert(cls, data)
+    result["search"] = benchmark_search(tree, queries)
+    result["frozen"] = benchmark_frozen_search(tree, queries) if hasattr(cls, "freeze") else None
+    result["delete"] = benchmark_deletion(tree, del_keys)
+    del tree
+    result["bulk"] = benchmark_insertion(cls, data) if hasattr(cls, "bulk_load") else None
+    return result
+
+def plot_times(ax, sizes, series, title, filename):
+    """
+    Clears the axes 'ax', plots each (label, times, linestyle) entry of
+    'series' against 'sizes' and saves the figure to 'filename'.
+    """
+    ax.clear()
+    for label, values, linestyle in series:
+        ax.plot(sizes, values, linestyle, label=label)
+    ax.set_xlabel("Number of Elements")
+    ax.set_ylabel("Time (seconds)")
+    ax.set_title(title)
+    ax.legend()
+    ax.figure.savefig(filename)
+
 def main():
     """
-    Benchmarks insertion, search, and deletion for AVL, Red-Black, and Treap.
+    Benchmarks insertion, search, and deletion for every tree in TREES.
     Generates line plots for each operation. 
     If '--export-dataset' is passed, it instead exports a dataset and exits.
+    '--jobs N' runs the (tree, size) benchmarks in N worker processes; they are
+    independent, but concurrent runs share caches and memory bandwidth, so the
+    default of 1 keeps the timings comparable.
     """
     if "--export-dataset" in sys.argv:
         export_dataset(n=1000000, seed=123, filename="my_dataset.txt")
@@ -115,103 +296,82 @@ def main():
     # Default sizes for benchmarking
     sizes = [100000, 500000, 1000000]
 
-    avl_insert_times, rb_insert_times, treap_insert_times = [], [], []
-    avl_search_times, rb_search_times, treap_search_times = [], [], []
-    avl_delete_times, rb_delete_times, treap_delete_times = [], [], []
-
-    for s in sizes:
-        print(f"\n=== Data size: {s} ===")
-        data = generate_random_data(n=s, seed=123)
-
-        # Prepare queries (search)
-        query_count = min(20000, s)
-        existing_part = random.sample(data, query_count // 2)
-        new_part = generate_random_data(n=query_count // 2, seed=999)
-        queries = existing_part + new_part
-        random.shuffle(queries)
-
-        # Prepare keys (deletion)
-        delete_count = min(20000, s)
-        existing_del_part = random.sample(data, delete_count // 2)
-        new_del_part = generate_random_data(n=delete_count // 2, seed=1234)
-        del_keys = existing_del_part + new_del_part
-        random.shuffle(del_keys)
-
-        # Insertion
-        avl_insert_time = benchmark_insertion(AVLTree, data)
-        rb_insert_time = benchmark_insertion(RBTree, data)
-        treap_insert_time = benchmark_insertion(Treap, data)
-
-        print("==== INSERTION TIMES ====")
-        print(f"AVL:   {avl_insert_time:.4f}s")
-        print(f"RB:    {rb_insert_time:.4f}s")
-        print(f"Treap: {treap_insert_time:.4f}s")
-
-        # Search
-        avl_search_time, avl_found = benchmark_search(AVLTree, data, queries)
-        rb_search_time, rb_found = benchmark_search(RBTree, data, queries)
-        treap_search_time, treap_found = benchmark_search(Treap, data, queries)
-
-        print("\n==== SEARCH TIMES ====")
-        print(f"AVL:   {avl_search_time:.4f}s, Found {avl_found}/{len(queries)}")
-        print(f"RB:    {rb_search_time:.4f}s, Found {rb_found}/{len(queries)}")
-        print(f"Treap: {treap_search_time:.4f}s, Found {treap_found}/{len(queries)}")
-
-        # Deletion
-        avl_delete_time = benchmark_deletion(AVLTree, data, del_keys)
-        rb_delete_time = benchmark_deletion(RBTree, data, del_keys)
-        treap_delete_time = benchmark_deletion(Treap, data, del_keys)
-
-        print("\n==== DELETION TIMES ====")
-        print(f"AVL:   {avl_delete_time:.4f}s")
-        print(f"RB:    {rb_delete_time:.4f}s")
-        print(f"Treap: {treap_delete_time:.4f}s")
-
-        # Store times
-        avl_insert_times.append(avl_insert_time)
-        rb_insert_times.append(rb_insert_time)
-        treap_insert_times.append(treap_insert_time)
-
-        avl_search_times.append(avl_search_time)
-        rb_search_times.append(rb_search_time)
-        treap_search_times.append(treap_search_time)
-
-        avl_delete_times.append(avl_delete_time)
-        rb_delete_times.append(rb_delete_time)
-        treap_delete_times.append(treap_delete_time)
-
-    # Plot: Insertion
-    plt.figure()
-    plt.plot(sizes, avl_insert_times, label="AVL Insert")
-    plt.plot(sizes, rb_insert_times, label="RB Insert")
-    plt.plot(sizes, treap_insert_times, label="Treap Insert")
-    plt.xlabel("Number of Elements")
-    plt.ylabel("Time (seconds)")
-    plt.title("Insertion Time Comparison")
-    plt.legend()
-    plt.savefig("insertion_times.png")
-
-    # Plot: Search
-    plt.figure()
-    plt.plot(sizes, avl_search_times, label="AVL Search")
-    plt.plot(sizes, rb_search_times, label="RB Search")
-    plt.plot(sizes, treap_search_times, label="Treap Search")
-    plt.xlabel("Number of Elements")
-    plt.ylabel("Time (seconds)")
-    plt.title("Search Time Comparison")
-    plt.legend()
-    plt.savefig("search_times.png")
+    insert_times = {name: [] for name in TREES}
+    bulk_times = {name: [] for name, cls in TREES.items() if hasattr(cls, "bulk_load")}
+    search_times = {name: [] for name in TREES}
+    frozen_times = {name: [] for name, cls in TREES.items() if hasattr(cls, "freeze")}
+    delete_times = {name: [] for name in TREES}
+
+    jobs = int(sys.argv[sys.argv.index("--jobs") + 1]) if "--jobs" in sys.argv else 1
+
+    # One job per (tree, size); results come back in submission order
+    names = [name for s in sizes for name in TREES]
+    job_sizes = [s for s in sizes for name in TREES]
+    # The pool (if any) is shut down on leaving the block, also when a job raises
+    with (ProcessPoolExecutor(max_workers=jobs, initializer=warm_up, initargs=(list(TREES.values()),))
+          if jobs > 1 else nullcontext()) as pool:
+        if pool is None:
+            warm_up(TREES.values())
+            results = map(run_tree, names, job_sizes)
+        else:
+            results = pool.map(run_tree, names, job_sizes)
+
+        for s in sizes:
+            size_results = {name: next(results) for name in TREES}
+            print(f"\n=== Data size: {s} ===")
+
+            # Insertion
+            print("==== INSERTION TIMES ====")
+            for name in TREES:
+                insert_times[name].append(size_results[name]["insert"])
+                print(f"{name + ':':<10}{insert_times[name][-1]:.4f}s")
+
+            # Bulk load (sorted, balanced build)
+            print("\n==== BULK LOAD TIMES ====")
+            for name in bulk_times:
+                bulk_times[name].append(size_results[name]["bulk"])
+                print(f"{name + ':':<10}{bulk_times[name][-1]:.4f}s")
+
+            # Search
+            print("\n==== SEARCH TIMES ====")
+            query_count = min(20000, s)
+            for name in TREES:
+                elapsed, found = size_results[name]["search"]
+                search_times[name].append(elapsed)
+                print(f"{name + ':':<10}{elapsed:.4f}s, Found {found}/{query_count}")
+
+            # Search over a frozen (Eytzinger-ordered) snapshot
+            print("\n==== FROZEN SEARCH TIMES ====")
+            for name in frozen_times:
+                elapsed, found = size_results[name]["frozen"]
+                frozen_times[name].append(elapsed)
+                print(f"{name + ':':<10}{elapsed:.4f}s, Found {found}/{query_count}")
+
+            # Deletion
+            print("\n==== DELETION TIMES ====")
+            for name in TREES:
+                delete_times[name].append(size_results[name]["delete"])
+                print(f"{name + ':':<10}{delete_times[name][-1]:.4f}s")
+
+    # One figure, cleared and reused for each plot
+    fig, ax = plt.subplots()
+
+    # Plot: Insertion (bulk loads dashed on the same axes)
+    plot_times(ax, sizes,
+               [(f"{name} Insert", t, "-") for name, t in insert_times.items()]
+               + [(f"{name} Bulk Load", t, "--") for name, t in bulk_times.items()],
+               "Insertion Time Comparison", "insertion_times.png")
+
+    # Plot: Search (frozen snapshots dashed on the same axes)
+    plot_times(ax, sizes,
+               [(f"{name} Search", t, "-") for name, t in search_times.items()]
+               + [(f"{name} Frozen Search", t, "--") for name, t in frozen_times.items()],
+               "Search Time Comparison", "search_times.png")
 
     # Plot: Deletion
-    plt.figure()
-    plt.plot(sizes, avl_delete_times, label="AVL Delete")
-    plt.plot(sizes, rb_delete_times, label="RB Delete")
-    plt.plot(sizes, treap_delete_times, label="Treap Delete")
-    plt.xlabel("Number of Elements")
-    plt.ylabel("Time (seconds)")
-    plt.title("Deletion Time Comparison")
-    plt.legend()
-    plt.savefig("deletion_times.png")
+    plot_times(ax, sizes, [(f"{name} Delete", t, "-") for name, t in delete_times.items()],
+               "Deletion Time Comparison", "deletion_times.png")
+    plt.close(fig)
 
     print("\nPlots saved as 'insertion_times.png', 'search_times.png', and 'deletion_times.png'.")
 
@@ -0,0 +1,15 @@
+"""
+Builds the optional Cython cores used by CRBTree (Red_Black_Tree.py) and
+CTreap (Treap.py). Run from this folder with:
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    ext_modules=cythonize(
+        ["_rbtree_core.pyx", "_treap_core.pyx"],
+        compiler_directives={"language_level": 3, "boundscheck": False, "wraparound": False},
+    ),
+)
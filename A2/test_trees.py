@@ -0,0 +1,690 @@
+import unittest
+import random
+
+from AVL_Tree import AVLTree, search_veb
+from Red_Black_Tree import RBTree, CRBTree, CRBNode
+from Treap import Treap, CTreap, CTreapNode
+from B_Tree import BTree
+from AVL_Tree_Array import ArrayAVLTree
+from Red_Black_Tree_Array import ArrayRBTree
+from Sorted_Array import SortedArraySet
+
+try:
+    from AVL_Tree_Numba import NumbaAVLTree
+    from Treap_Numba import NumbaTreap
+except ImportError:  # numba/numpy not installed
+    NumbaAVLTree = NumbaTreap = None
+
+class TestAVLTree(unittest.TestCase):
+    """
+    Unit tests for AVLTree implementation.
+    """
+    def setUp(self):
+        """
+        Runs before each test. Initializes an empty AVLTree.
+        """
+        self.tree = AVLTree()
+
+    def tearDown(self):
+        """
+        Runs after each test (optional cleanup).
+        """
+        pass
+
+    def test_insert_and_search_single(self):
+        """
+        Test inserting a single key and searching for it.
+        Expects the inserted key to be found, and a non-existent key to be false.
+        """
+        self.tree.insert(10)
+        self.assertTrue(self.tree.search(10), "AVL should find key=10 after insertion.")
+        self.assertFalse(self.tree.search(99), "AVL should not find non-existent key=99.")
+
+    def test_insert_duplicates(self):
+        """
+        Test behavior when inserting duplicate keys.
+        By default, many BSTs allow duplicates either on left or right.
+        We only verify that searching for the key is true afterward.
+        """
+        self.tree.insert(20)
+        self.tree.insert(20)
+        self.assertTrue(self.tree.search(20), "Duplicated key=20 should still be found.")
+
+    def test_many_duplicates(self):
+        """
+        Insert a small key range many times over (forcing rotations on equal keys),
+        then delete every copy of half the keys.
+        """
+        random.seed(7)
+        keys = [random.randrange(20) for _ in range(300)]
+        for k in keys:
+            self.tree.insert(k)
+        for k in keys:
+            if k % 2 == 0:
+                self.tree.delete(k)
+        for k in range(20):
+            self.assertEqual(self.tree.search(k), k % 2 == 1 and k in keys, f"Unexpected result for key={k}.")
+
+    def test_bulk_load(self):
+        """
+        Bulk-load unsorted keys (with duplicates), then keep using the tree
+        with regular inserts and deletes.
+        """
+        random.seed(11)
+        keys = [random.randrange(500) for _ in range(300)]
+        self.tree.bulk_load(keys)
+        for k in range(500):
+            self.assertEqual(self.tree.search(k), k in keys, f"Unexpected result for key={k} after bulk load.")
+        self.tree.insert(1000)
+        for k in keys:
+            self.tree.delete(k)
+        self.assertTrue(self.tree.search(1000))
+        self.assertFalse(any(self.tree.search(k) for k in keys))
+
+    def test_delete_existing_key(self):
+        """
+        Insert several keys, then delete one known key. 
+        Verify it's no longer found.
+        """
+        keys = [30, 10, 50, 20, 40]
+        for k in keys:
+            self.tree.insert(k)
+        self.assertTrue(self.tree.search(20))
+        self.tree.delete(20)
+        self.assertFalse(self.tree.search(20), "AVL should not find key=20 after deletion.")
+
+    def test_delete_nonexistent_key(self):
+        """
+        Insert several keys, then attempt deleting a non-existent key (999).
+        The tree should remain unaffected.
+        """
+        keys = [1, 2, 3]
+        for k in keys:
+            self.tree.insert(k)
+        self.tree.delete(999)  # Key doesn't exist
+        for k in keys:
+            self.assertTrue(self.tree.search(k), f"Key={k} should remain after invalid deletion.")
+
+    def test_search_count(self):
+        """
+        search_count() agrees with calling search() on each query, including
+        on the empty tree.
+        """
+        self.assertEqual(self.tree.search_count([1, 2, 3]), 0)
+        random.seed(9)
+        for k in random.sample(range(1000), 300):
+            self.tree.insert(k)
+        queries = [random.randrange(1200) for _ in range(500)]
+        self.assertEqual(self.tree.search_count(queries), sum(self.tree.search(q) for q in queries))
+
+    def test_bulk_insertion(self):
+        """
+        Insert a range of keys (0..99) and confirm they exist.
+        """
+        for i in range(100):
+            self.tree.insert(i)
+        for check_val in [0, 50, 99]:
+            self.assertTrue(
+                self.tree.search(check_val),
+                f"AVL should contain key={check_val} after bulk insertion."
+            )
+
+    def test_bulk_deletion(self):
+        """
+        Insert a range of keys (0..99), then delete them all.
+        Confirm the tree is empty afterward.
+        """
+        for i in range(100):
+            self.tree.insert(i)
+        for i in range(100):
+            self.tree.delete(i)
+        for i in range(100):
+            self.assertFalse(self.tree.search(i), f"Key={i} should be removed from AVL.")
+
+
+class TestAVLTreeFrozen(unittest.TestCase):
+    """
+    Unit tests for the read-only snapshot layouts of AVLTree.
+    """
+    def setUp(self):
+        random.seed(3)
+        self.keys = random.sample(range(5000), 1000)
+        self.tree = AVLTree()
+        for k in self.keys:
+            self.tree.insert(k)
+
+    def test_search_frozen(self):
+        """
+        Every inserted key (and no other key) is found in the Eytzinger snapshot.
+        """
+        present = set(self.keys)
+        for k in range(-1, 5001):
+            self.assertEqual(self.tree.search_frozen(k), k in present, f"Frozen lookup wrong for key={k}.")
+
+    def test_search_triangles(self):
+        """
+        The two-levels-per-step triangle snapshot agrees with the key set,
+        for both odd and even tree heights.
+        """
+        present = set(self.keys)
+        for k in range(-1, 5001):
+            self.assertEqual(self.tree.search_triangles(k), k in present, f"Triangle lookup wrong for key={k}.")
+        small = AVLTree()
+        for k in range(1, 600, 2):
+            small.insert(k)
+            self.assertTrue(small.search_triangles(k))
+            self.assertFalse(small.search_triangles(k + 1))
+
+    def test_search_top(self):
+        """
+        Lookups through the top-level cache agree with the plain search,
+        including after updates that do and don't reach the cached levels.
+        """
+        present = set(self.keys)
+        for k in self.keys[:200]:
+            self.tree.delete(k)
+            present.discard(k)
+            self.tree.insert(k + 5000)
+            present.add(k + 5000)
+            self.assertTrue(self.tree.search_top(k + 5000))
+            self.assertEqual(self.tree.search_top(k), k in present)
+        for k in range(-1, 10001):
+            self.assertEqual(self.tree.search_top(k), k in present, f"Top-cache lookup wrong for key={k}.")
+
+    def test_search_veb(self):
+        """
+        The van Emde Boas dump is searchable straight from its bytes, including
+        through a read-only memoryview, and an empty tree dumps to nothing.
+        """
+        present = set(self.keys)
+        buf = memoryview(bytes(self.tree.to_veb_bytes()))
+        self.assertEqual(len(buf), 16 * len(present))
+        for k in range(-1, 5001):
+            self.assertEqual(search_veb(buf, k), k in present, f"vEB lookup wrong for key={k}.")
+        self.assertFalse(search_veb(AVLTree().to_veb_bytes(), 1))
+
+    def test_snapshot_refreshed_after_update(self):
+        """
+        Insert/delete discard the snapshot, so frozen lookups see the change.
+        """
+        self.tree.freeze()
+        self.tree.insert(-7)
+        self.tree.delete(self.keys[0])
+        self.assertTrue(self.tree.search_frozen(-7))
+        self.assertFalse(self.tree.search_frozen(self.keys[0]))
+
+
+class TestArrayAVLTree(TestAVLTree):
+    """
+    Runs the AVLTree tests against the array-backed ArrayAVLTree.
+    """
+    def setUp(self):
+        self.tree = ArrayAVLTree()
+
+    def test_rejects_non_int_keys(self):
+        """
+        Keys are stored as int64, so floats and strings raise TypeError
+        and leave the tree usable.
+        """
+        self.tree.insert(5)
+        self.tree.delete(5)
+        for bad in (1.5, "7"):
+            with self.assertRaises(TypeError):
+                self.tree.insert(bad)
+        self.tree.insert(3)
+        self.assertTrue(self.tree.search(3))
+
+
+@unittest.skipIf(NumbaAVLTree is None, "numba is not installed")
+class TestNumbaAVLTree(TestAVLTree):
+    """
+    Runs the AVLTree tests against the Numba-compiled NumbaAVLTree.
+    """
+    def setUp(self):
+        self.tree = NumbaAVLTree(capacity=16)
+
+    def test_search_batch(self):
+        """
+        search_batch() agrees with search() for present and absent keys.
+        """
+        random.seed(5)
+        keys = random.sample(range(2000), 500)
+        for k in keys:
+            self.tree.insert(k)
+        queries = list(range(-5, 2005))
+        mask = self.tree.search_batch(queries)
+        self.assertEqual(mask.tolist(), [self.tree.search(q) for q in queries])
+        self.assertEqual(int(mask.sum()), len(keys))
+        self.assertEqual(len(NumbaAVLTree().search_batch([1, 2])), 2)
+
+    def test_insert_and_delete_batch(self):
+        """
+        insert_batch()/delete_batch() (with duplicates, absent keys and
+        reused slots) leave the same keys as one insert()/delete() per key.
+        """
+        random.seed(6)
+        keys = [random.randrange(300) for _ in range(400)]
+        self.tree.insert_batch(keys)
+        self.tree.delete_batch(keys[::3] + [-1, 999])
+        self.tree.insert_batch(keys[::5])
+        model = NumbaAVLTree(capacity=16)
+        for k in keys:
+            model.insert(k)
+        for k in keys[::3] + [-1, 999]:
+            model.delete(k)
+        for k in keys[::5]:
+            model.insert(k)
+        queries = list(range(-5, 305))
+        self.assertEqual(self.tree.search_batch(queries).tolist(), model.search_batch(queries).tolist())
+
+
+class TestRBTree(unittest.TestCase):
+    """
+    Unit tests for RBTree (Red-Black Tree) implementation.
+    """
+    def setUp(self):
+        self.tree = RBTree()
+
+    def test_insert_search_delete(self):
+        """
+        Insert several keys, verify they can be searched, then delete some and verify they're gone.
+        """
+        data = [15, 6, 3, 20, 18, 25]
+        for val in data:
+            self.tree.insert(val)
+        for val in data:
+            self.assertTrue(self.tree.search(val), f"RBTree should find inserted key={val}.")
+
+        self.tree.delete(6)
+        self.assertFalse(self.tree.search(6), "RBTree should not find deleted key=6.")
+        self.tree.delete(18)
+        self.assertFalse(self.tree.search(18), "RBTree should not find deleted key=18.")
+        
+        self.assertTrue(self.tree.search(15), "RBTree should still contain key=15.")
+        self.assertTrue(self.tree.search(25), "RBTree should still contain key=25.")
+
+    def test_bulk_load(self):
+        """
+        Bulk-load unsorted keys (with duplicates), then keep using the tree
+        with regular inserts and deletes.
+        """
+        random.seed(12)
+        keys = [random.randrange(500) for _ in range(300)]
+        self.tree.bulk_load(keys)
+        for k in range(500):
+            self.assertEqual(self.tree.search(k), k in keys, f"Unexpected result for key={k} after bulk load.")
+        self.tree.insert(1000)
+        for k in keys:
+            self.tree.delete(k)
+        self.assertTrue(self.tree.search(1000))
+        self.assertFalse(any(self.tree.search(k) for k in keys))
+
+    def test_duplicates(self):
+        """
+        Insert duplicate keys and check if searching returns True.
+        """
+        self.tree.insert(10)
+        self.tree.insert(10)
+        self.assertTrue(self.tree.search(10), "RBTree should find duplicate key=10.")
+
+    def test_nonexistent_delete(self):
+        """
+        Deleting a key that doesn't exist should not affect the tree.
+        """
+        self.tree.insert(100)
+        self.tree.delete(999)
+        self.assertTrue(self.tree.search(100), "Key=100 should remain after invalid deletion.")
+
+    def test_search_count(self):
+        """
+        search_count() agrees with calling search() on each query, including
+        on the empty tree.
+        """
+        self.assertEqual(self.tree.search_count([1, 2, 3]), 0)
+        random.seed(9)
+        for k in random.sample(range(1000), 300):
+            self.tree.insert(k)
+        queries = [random.randrange(1200) for _ in range(500)]
+        self.assertEqual(self.tree.search_count(queries), sum(self.tree.search(q) for q in queries))
+
+    def test_bulk_insertion(self):
+        """
+        Insert 200 unique random values, verify each is found.
+        """
+        random.seed(42)
+        nums = random.sample(range(1000), 200)
+        for n in nums:
+            self.tree.insert(n)
+        for n in nums:
+            self.assertTrue(self.tree.search(n), f"RBTree missing inserted key={n}.")
+
+    def test_bulk_deletion(self):
+        """
+        Insert 100 keys, delete them all, verify they're gone.
+        """
+        for i in range(100):
+            self.tree.insert(i)
+        for i in range(100):
+            self.tree.delete(i)
+        for i in range(100):
+            self.assertFalse(self.tree.search(i), f"Key={i} should be deleted from RBTree.")
+
+
+class TestArrayRBTree(TestRBTree):
+    """
+    Runs the RBTree tests against the array-backed ArrayRBTree.
+    """
+    def setUp(self):
+        self.tree = ArrayRBTree()
+
+    def test_rejects_non_int_keys(self):
+        """
+        Keys are stored as int64, so floats and strings raise TypeError
+        and leave the tree usable.
+        """
+        self.tree.insert(5)
+        self.tree.delete(5)
+        for bad in (1.5, "7"):
+            with self.assertRaises(TypeError):
+                self.tree.insert(bad)
+        self.assertEqual(self.tree._free, [1], "A rejected key should not consume the freed slot.")
+        self.tree.insert(3)
+        self.assertTrue(self.tree.search(3))
+
+
+@unittest.skipIf(CRBNode is None, "_rbtree_core extension is not built")
+class TestCRBTree(TestRBTree):
+    """
+    Runs the RBTree tests against CRBTree (Cython core).
+    """
+    def setUp(self):
+        self.tree = CRBTree()
+
+
+class TestTreap(unittest.TestCase):
+    """
+    Unit tests for Treap implementation.
+    """
+    def setUp(self):
+        self.tree = Treap()
+
+    def test_basic_operations(self):
+        """
+        Insert a few items, verify search, then delete some and verify they're gone.
+        """
+        items = [5, 2, 8, 1, 3]
+        for it in items:
+            self.tree.insert(it)
+        for it in items:
+            self.assertTrue(self.tree.search(it), f"Treap should contain key={it}.")
+
+        self.tree.delete(2)
+        self.assertFalse(self.tree.search(2), "Treap should not find deleted key=2.")
+        self.tree.delete(8)
+        self.assertFalse(self.tree.search(8), "Treap should not find deleted key=8.")
+
+    def test_bulk_load(self):
+        """
+        Bulk-load unsorted keys (with duplicates), then keep using the treap
+        with regular inserts and deletes.
+        """
+        random.seed(13)
+        keys = [random.randrange(500) for _ in range(300)]
+        self.tree.bulk_load(keys)
+        for k in range(500):
+            self.assertEqual(self.tree.search(k), k in keys, f"Unexpected result for key={k} after bulk load.")
+        self.tree.insert(1000)
+        for k in keys:
+            self.tree.delete(k)
+        self.assertTrue(self.tree.search(1000))
+        self.assertFalse(any(self.tree.search(k) for k in keys))
+
+    def test_duplicate_inserts(self):
+        """
+        Insert the same key more than once, ensure searching it is still True.
+        """
+        self.tree.insert(50)
+        self.tree.insert(50)
+        self.assertTrue(self.tree.search(50), "Treap should find duplicate key=50.")
+
+    def test_delete_nonexistent(self):
+        """
+        Deleting a key that doesn't exist should not break the treap.
+        """
+        self.tree.insert(10)
+        self.tree.delete(999)
+        self.assertTrue(self.tree.search(10), "Key=10 should remain after invalid deletion.")
+
+    def test_search_count(self):
+        """
+        search_count() agrees with calling search() on each query, including
+        on the empty tree.
+        """
+        self.assertEqual(self.tree.search_count([1, 2, 3]), 0)
+        random.seed(9)
+        for k in random.sample(range(1000), 300):
+            self.tree.insert(k)
+        queries = [random.randrange(1200) for _ in range(500)]
+        self.assertEqual(self.tree.search_count(queries), sum(self.tree.search(q) for q in queries))
+
+    def test_bulk_insertion(self):
+        """
+        Insert 0..99, verify a few known keys, then do partial deletes and re-check.
+        """
+        for val in range(100):
+            self.tree.insert(val)
+        # Check random subset
+        for check_val in [0, 50, 99]:
+            self.assertTrue(self.tree.search(check_val), f"Treap missing inserted key={check_val}.")
+
+    def test_bulk_deletion(self):
+        """
+        Insert 0..99, then delete them all, verifying none remains.
+        """
+        for val in range(100):
+            self.tree.insert(val)
+        for val in range(100):
+            self.tree.delete(val)
+        for val in range(100):
+            self.assertFalse(self.tree.search(val), f"Treap should not contain key={val} after deletion.")
+
+
+class TestFrozenSearch(unittest.TestCase):
+    """
+    Unit tests for freeze()/search_frozen() on the Red-Black Tree and Treap.
+    """
+    def test_search_frozen(self):
+        """
+        The Eytzinger snapshot agrees with the key set, and is rebuilt after
+        inserts and deletes.
+        """
+        random.seed(4)
+        keys = random.sample(range(5000), 1000)
+        for cls in (RBTree, Treap):
+            with self.subTest(tree=cls.__name__):
+                tree = cls()
+                for k in keys:
+                    tree.insert(k)
+                present = set(keys)
+                for k in range(-1, 5001):
+                    self.assertEqual(tree.search_frozen(k), k in present, f"Frozen lookup wrong for key={k}.")
+                tree.delete(keys[0])
+                tree.insert(6000)
+                self.assertFalse(tree.search_frozen(keys[0]))
+                self.assertTrue(tree.search_frozen(6000))
+                self.assertFalse(cls().search_frozen(1))
+
+
+@unittest.skipIf(NumbaTreap is None, "numba is not installed")
+class TestNumbaTreap(TestTreap):
+    """
+    Runs the Treap tests against the Numba-compiled NumbaTreap.
+    """
+    def setUp(self):
+        self.tree = NumbaTreap(capacity=16)
+
+    def test_search_batch(self):
+        """
+        search_batch() agrees with search() for present and absent keys.
+        """
+        random.seed(5)
+        keys = random.sample(range(2000), 500)
+        for k in keys:
+            self.tree.insert(k)
+        queries = list(range(-5, 2005))
+        mask = self.tree.search_batch(queries)
+        self.assertEqual(mask.tolist(), [self.tree.search(q) for q in queries])
+        self.assertEqual(int(mask.sum()), len(keys))
+        self.assertEqual(len(NumbaTreap().search_batch([1, 2])), 2)
+
+    def test_insert_and_delete_batch(self):
+        """
+        insert_batch()/delete_batch() (with duplicates, absent keys and
+        reused slots) leave the same keys as one insert()/delete() per key.
+        """
+        random.seed(6)
+        keys = [random.randrange(300) for _ in range(400)]
+        self.tree.insert_batch(keys)
+        self.tree.delete_batch(keys[::3] + [-1, 999])
+        self.tree.insert_batch(keys[::5])
+        model = NumbaTreap(capacity=16)
+        for k in keys:
+            model.insert(k)
+        for k in keys[::3] + [-1, 999]:
+            model.delete(k)
+        for k in keys[::5]:
+            model.insert(k)
+        queries = list(range(-5, 305))
+        self.assertEqual(self.tree.search_batch(queries).tolist(), model.search_batch(queries).tolist())
+
+
+@unittest.skipIf(CTreapNode is None, "_treap_core extension is not built")
+class TestCTreap(TestTreap):
+    """
+    Runs the Treap tests against CTreap (Cython core).
+    """
+    def setUp(self):
+        self.tree = CTreap()
+
+
+class TestBTree(unittest.TestCase):
+    """
+    Unit tests for BTree. A minimum degree of 2 keeps nodes tiny, so node
+    splits, borrows and merges all happen with few keys.
+    """
+    def setUp(self):
+        self.tree = BTree(t=2)
+
+    def test_insert_search_delete(self):
+        """
+        Insert several keys, verify they can be searched, then delete some and verify they're gone.
+        """
+        data = [15, 6, 3, 20, 18, 25, 1, 9]
+        for val in data:
+            self.tree.insert(val)
+        for val in data:
+            self.assertTrue(self.tree.search(val), f"BTree should find inserted key={val}.")
+        self.tree.delete(6)
+        self.assertFalse(self.tree.search(6), "BTree should not find deleted key=6.")
+        self.tree.delete(18)
+        self.assertFalse(self.tree.search(18), "BTree should not find deleted key=18.")
+        self.assertTrue(self.tree.search(15), "BTree should still contain key=15.")
+
+    def test_duplicates(self):
+        """
+        Insert a key three times; it stays findable until every copy is deleted.
+        """
+        for _ in range(3):
+            self.tree.insert(10)
+        for _ in range(2):
+            self.tree.delete(10)
+            self.assertTrue(self.tree.search(10), "A remaining copy of key=10 should be found.")
+        self.tree.delete(10)
+        self.assertFalse(self.tree.search(10), "Key=10 should be gone after deleting every copy.")
+
+    def test_nonexistent_delete(self):
+        """
+        Deleting a key that doesn't exist should not affect the tree.
+        """
+        self.tree.insert(100)
+        self.tree.delete(999)
+        self.assertTrue(self.tree.search(100), "Key=100 should remain after invalid deletion.")
+
+    def test_random_operations(self):
+        """
+        Random inserts and deletes (with repeats) agree with a plain list model.
+        """
+        random.seed(21)
+        model = []
+        for _ in range(3000):
+            k = random.randrange(200)
+            if random.random() < 0.6:
+                self.tree.insert(k)
+                model.append(k)
+            else:
+                self.tree.delete(k)
+                if k in model:
+                    model.remove(k)
+        for k in range(200):
+            self.assertEqual(self.tree.search(k), k in model, f"Unexpected result for key={k}.")
+
+    def test_search_count(self):
+        """
+        search_count() agrees with calling search() on each query, including
+        on the empty tree.
+        """
+        self.assertEqual(self.tree.search_count([1, 2, 3]), 0)
+        random.seed(9)
+        for k in random.sample(range(1000), 300):
+            self.tree.insert(k)
+        queries = [random.randrange(1200) for _ in range(500)]
+        self.assertEqual(self.tree.search_count(queries), sum(self.tree.search(q) for q in queries))
+
+    def test_bulk_deletion(self):
+        """
+        Insert 100 keys, delete them all, verify they're gone and the root is an empty leaf.
+        """
+        for i in range(100):
+            self.tree.insert(i)
+        for i in range(100):
+            self.tree.delete(i)
+        for i in range(100):
+            self.assertFalse(self.tree.search(i), f"Key={i} should be deleted from BTree.")
+        self.assertEqual((self.tree.root.keys, self.tree.root.children), ([], []))
+
+
+class TestSortedArraySet(TestAVLTree):
+    """
+    Runs the AVLTree tests against SortedArraySet. A LOAD of 2 keeps blocks
+    tiny, so block splits and removals happen with few keys.
+    """
+    def setUp(self):
+        self.tree = SortedArraySet()
+        self.tree.LOAD = 2
+
+    def test_random_operations(self):
+        """
+        Random inserts and deletes (with repeats) keep the blocks in sorted
+        order with matching maxes, and agree with a plain list model.
+        """
+        random.seed(21)
+        model = []
+        for _ in range(3000):
+            k = random.randrange(200)
+            if random.random() < 0.6:
+                self.tree.insert(k)
+                model.append(k)
+            else:
+                self.tree.delete(k)
+                if k in model:
+                    model.remove(k)
+        blocks = self.tree.blocks
+        self.assertEqual([k for block in blocks for k in block], sorted(model))
+        self.assertEqual(self.tree.maxes, [block[-1] for block in blocks])
+        self.assertTrue(all(0 < len(block) <= 4 for block in blocks))
+        for k in range(200):
+            self.assertEqual(self.tree.search(k), k in model, f"Unexpected result for key={k}.")
+
+
+if __name__ == "__main__":
+    unittest.main()